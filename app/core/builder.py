@@ -2,16 +2,51 @@
 
 import sys
 import os
+import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import ClassVar, Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
 
 from app.core.config_manager import BuildConfig
 from app.core.logger import get_logger
-from app.utils.shell import run_command_stream, get_python_executable, open_folder
+from app.utils.shell import (
+    run_command_stream, get_python_executable, open_folder, stop_process_tree,
+    NO_WINDOW_FLAGS
+)
+
+# PyInstaller --add-data separator: ; on Windows and : on Linux/Mac
+_PATH_SEP = ';' if sys.platform == 'win32' else ':'
+
+
+def _mode_flags(one_file: bool, console_mode: bool, clean_build: bool) -> Tuple[str, ...]:
+    """Build the fixed PyInstaller flags for one combination of build options."""
+    flags = [
+        # One file vs one directory
+        "--onefile" if one_file else "--onedir",
+    ]
+    # Console mode
+    if not console_mode:
+        flags.append("--noconsole")
+    # Clean build (remove previous build cache)
+    if clean_build:
+        flags.append("--clean")
+    # Don't ask for confirmation to overwrite
+    flags.append("--noconfirm")
+    return tuple(sys.intern(f) for f in flags)
+
+
+# Mode flags for every (one_file, console_mode, clean_build) combination
+_STATIC_FLAGS = {
+    (one_file, console_mode, clean_build): _mode_flags(one_file, console_mode, clean_build)
+    for one_file in (True, False)
+    for console_mode in (True, False)
+    for clean_build in (True, False)
+}
 
 
 class BuildStatus(Enum):
@@ -23,6 +58,25 @@ class BuildStatus(Enum):
     CANCELLED = "cancelled"
 
 
+def _config_key(config: BuildConfig, python_path: str, icon_exists: bool) -> Tuple:
+    """Build a hashable key describing everything that affects the argv."""
+    return (
+        python_path,
+        icon_exists,
+        config.script_path,
+        config.one_file,
+        config.console_mode,
+        config.clean_build,
+        config.output_dir,
+        config.app_name,
+        config.icon_path,
+        tuple(config.hidden_imports),
+        tuple(config.exclude_modules),
+        tuple(config.data_files),
+        config.additional_args,
+    )
+
+
 @dataclass
 class BuildResult:
     """Result of a build operation."""
@@ -36,46 +90,95 @@ class BuildWorker(QThread):
     """Worker thread for running PyInstaller builds."""
 
     # Signals
-    output_line = pyqtSignal(str)
+    output_line = pyqtSignal(str)  # one or more newline-separated lines
     build_finished = pyqtSignal(object)  # BuildResult
     status_changed = pyqtSignal(str)  # status message
 
+    # How often buffered build output is forwarded to the UI
+    OUTPUT_FLUSH_MS = 50
+    # Seconds to wait for PyInstaller to exit after terminate() before kill()
+    TERMINATE_TIMEOUT = 2
+
+    # Built argv per distinct config, shared by all workers
+    MAX_CACHED_COMMANDS = 32
+    _cmd_cache: ClassVar[Dict[Tuple, List[str]]] = {}
+
     def __init__(self, config: BuildConfig, python_path: Optional[str] = None):
         super().__init__()
         self.config = config
         self.python_path = python_path or get_python_executable()
         self.logger = get_logger()
-        self._cancelled = False
+        self._cancelled = threading.Event()
+        self._creation_flags = NO_WINDOW_FLAGS
+        self._proc: Optional[subprocess.Popen] = None
+
+        # Paths derived from the config, computed once per worker
+        self._script_parent = Path(config.script_path).parent if config.script_path else None
+        self._output_path = Path(config.output_dir) if config.output_dir else None
+
+        # Output lines are buffered by the worker thread and flushed in
+        # batches by a timer living in the owning (GUI) thread
+        self._line_buf: List[str] = []
+        self._line_lock = threading.Lock()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.OUTPUT_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_output)
+        self.started.connect(self._flush_timer.start)
+        self.finished.connect(self._flush_timer.stop)
 
     def cancel(self):
-        """Request cancellation of the build."""
-        self._cancelled = True
+        """Request cancellation of the build without blocking the caller.
+
+        PyInstaller is stopped from a background thread; run() then emits
+        build_finished with a CANCELLED result.
+        """
+        self._cancelled.set()
+        threading.Thread(
+            target=self._stop_process, name="build-cancel", daemon=True
+        ).start()
+
+    def _on_process_started(self, process: subprocess.Popen):
+        """Keep the process handle so cancel() can stop it."""
+        self._proc = process
+        # cancel() may have run before the process existed
+        if self._cancelled.is_set():
+            self._stop_process()
+
+    def _stop_process(self):
+        """Stop PyInstaller and any children it started, killing them if needed."""
+        proc = self._proc
+        if proc is None:
+            return
+        stop_process_tree(proc, self.TERMINATE_TIMEOUT)
+
+    def _flush_output(self):
+        """Emit all buffered output lines as a single batch."""
+        with self._line_lock:
+            batch = self._line_buf[:]
+            self._line_buf.clear()
+        if batch:
+            self.output_line.emit("\n".join(batch))
 
     def _build_command(self) -> List[str]:
         """Build the PyInstaller command from config."""
-        cmd = [self.python_path, "-m", "PyInstaller"]
-
         # Script path (required)
         script_path = self.config.script_path
         if not script_path:
             raise ValueError("Script path is required")
 
-        # One file vs one directory
-        if self.config.one_file:
-            cmd.append("--onefile")
-        else:
-            cmd.append("--onedir")
-
-        # Console mode
-        if not self.config.console_mode:
-            cmd.append("--noconsole")
+        # Checked on every build: the icon may be created after a first try
+        icon_exists = bool(self.config.icon_path) and Path(self.config.icon_path).exists()
+        key = _config_key(self.config, self.python_path, icon_exists)
+        cached = self._cmd_cache.get(key)
+        if cached is not None:
+            return list(cached)
 
-        # Clean build (remove previous build cache)
-        if self.config.clean_build:
-            cmd.append("--clean")
-
-        # Don't ask for confirmation to overwrite
-        cmd.append("--noconfirm")
+        cmd = [self.python_path, "-m", "PyInstaller"]
+        cmd += _STATIC_FLAGS[(
+            bool(self.config.one_file),
+            bool(self.config.console_mode),
+            bool(self.config.clean_build),
+        )]
 
         # Output directory
         if self.config.output_dir:
@@ -86,27 +189,23 @@ class BuildWorker(QThread):
             cmd.extend(["--name", self.config.app_name])
 
         # Icon
-        if self.config.icon_path and Path(self.config.icon_path).exists():
+        if icon_exists:
             cmd.extend(["--icon", self.config.icon_path])
 
+        # List entries are already stripped and non-empty (BuildConfig.__post_init__)
+
         # Hidden imports
         for hidden_import in self.config.hidden_imports:
-            if hidden_import.strip():
-                cmd.extend(["--hidden-import", hidden_import.strip()])
+            cmd.extend(["--hidden-import", hidden_import])
 
         # Exclude modules
         for exclude_module in self.config.exclude_modules:
-            if exclude_module.strip():
-                cmd.extend(["--exclude-module", exclude_module.strip()])
+            cmd.extend(["--exclude-module", exclude_module])
 
         # Data files (handle OS-specific path separator)
-        # PyInstaller uses ; on Windows and : on Linux/Mac
-        path_sep = ';' if sys.platform == 'win32' else ':'
         for data_file in self.config.data_files:
-            if data_file.strip():
-                # Convert stored format (always ;) to OS-specific format
-                normalized = data_file.strip().replace(';', path_sep)
-                cmd.extend(["--add-data", normalized])
+            # Convert stored format (always ;) to OS-specific format
+            cmd.extend(["--add-data", data_file.replace(';', _PATH_SEP)])
 
         # Additional arguments (user-provided raw args)
         if self.config.additional_args:
@@ -116,11 +215,13 @@ class BuildWorker(QThread):
         # Finally, the script
         cmd.append(script_path)
 
-        return cmd
+        if len(self._cmd_cache) >= self.MAX_CACHED_COMMANDS:
+            self._cmd_cache.clear()
+        self._cmd_cache[key] = cmd
+        return list(cmd)
 
     def run(self):
         """Execute the build process."""
-        import time
         start_time = time.time()
 
         try:
@@ -135,19 +236,28 @@ class BuildWorker(QThread):
             self.status_changed.emit("Building...")
 
             # Run the build
+            cancelled = self._cancelled.is_set
+            line_lock = self._line_lock
+            line_buf = self._line_buf
+
             def output_callback(line: str):
-                if not self._cancelled:
-                    self.output_line.emit(line)
+                if not cancelled():
+                    with line_lock:
+                        line_buf.append(line)
 
             result = run_command_stream(
                 cmd,
                 output_callback=output_callback,
-                cwd=Path(self.config.script_path).parent if self.config.script_path else None
+                cwd=self._script_parent,
+                creationflags=self._creation_flags,
+                process_callback=self._on_process_started,
+                new_session=True
             )
+            self._flush_output()
 
             build_time = time.time() - start_time
 
-            if self._cancelled:
+            if self._cancelled.is_set():
                 self.build_finished.emit(BuildResult(
                     status=BuildStatus.CANCELLED,
                     build_time=build_time
@@ -155,7 +265,7 @@ class BuildWorker(QThread):
                 return
 
             if result.success:
-                output_path = Path(self.config.output_dir) if self.config.output_dir else None
+                output_path = self._output_path
                 self.logger.success(f"Build completed in {build_time:.1f}s")
                 self.build_finished.emit(BuildResult(
                     status=BuildStatus.SUCCESS,
@@ -171,6 +281,7 @@ class BuildWorker(QThread):
                 ))
 
         except Exception as e:
+            self._flush_output()
             build_time = time.time() - start_time
             self.logger.error(f"Build error: {str(e)}")
             self.build_finished.emit(BuildResult(
@@ -214,9 +325,9 @@ class Builder:
     def cancel_build(self):
         """Cancel the current build."""
         if self.current_worker and self.current_worker.isRunning():
+            # Stopping the subprocess lets run() return on its own and
+            # report the cancellation through build_finished
             self.current_worker.cancel()
-            self.current_worker.terminate()
-            self.current_worker.wait()
 
     def is_building(self) -> bool:
         """Check if a build is in progress."""
@@ -1,14 +1,30 @@
 """Configuration management with JSON persistence."""
 
+import copy
+import functools
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, Optional
-from dataclasses import dataclass, field, asdict
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, fields
 
-from app.utils.paths import get_config_dir
+from app.utils.compat import DATACLASS_SLOTS
+from app.utils.paths import get_config_dir, ensure_dir
 
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used as a fallback
+    orjson = None
 
-@dataclass
+
+@functools.lru_cache(maxsize=8)
+def _read_json(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Read and parse a JSON file, cached per (path, mtime_ns)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class BuildConfig:
     """Build configuration settings."""
     script_path: str = ""
@@ -24,10 +40,16 @@ class BuildConfig:
     data_files: list = field(default_factory=list)
     additional_args: str = ""
 
+    def __post_init__(self):
+        # Normalize list entries once so consumers can skip strip/empty checks
+        self.hidden_imports = [s.strip() for s in self.hidden_imports if s.strip()]
+        self.exclude_modules = [s.strip() for s in self.exclude_modules if s.strip()]
+        self.data_files = [s.strip() for s in self.data_files if s.strip()]
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class InstallerConfig:
-    """Installer configuration settings."""
+    """Installer configuration settings (immutable; use dataclasses.replace)."""
     enabled: bool = False
     company_name: str = ""
     app_name: str = ""
@@ -37,6 +59,29 @@ class InstallerConfig:
     installer_type: str = "nsis"  # nsis or inno
 
 
+# Field names, resolved once so saves can read attributes directly
+_BUILD_FIELDS = tuple(f.name for f in fields(BuildConfig))
+_INSTALLER_FIELDS = tuple(f.name for f in fields(InstallerConfig))
+
+
+def _fast_asdict(obj: Any, field_names: tuple) -> Dict[str, Any]:
+    """Shallow dataclass-to-dict conversion for JSON serialization."""
+    return {name: getattr(obj, name) for name in field_names}
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]):
+    """Write JSON to a temp file and swap it in, so a crash never truncates it."""
+    tmp_path = path.with_suffix('.json.tmp')
+    if orjson is not None:
+        tmp_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
 @dataclass
 class AppConfig:
     """Main application configuration."""
@@ -46,6 +91,11 @@ class AppConfig:
     python_interpreter: str = ""
     auto_open_output: bool = True
     save_logs: bool = True
+    parallel_install: int = 1  # concurrent pip processes for requirements installs
+    max_log_blocks: int = 2000  # lines kept in the log console
+    log_level: str = "DEBUG"  # lowest level shown in the log console
+    zip_compression: str = "deflated"  # Zip Output plugin: stored, deflated, bzip2 or lzma
+    zip_compresslevel: int = 6
     build_config: BuildConfig = field(default_factory=BuildConfig)
     installer_config: InstallerConfig = field(default_factory=InstallerConfig)
     recent_projects: list = field(default_factory=list)
@@ -57,21 +107,35 @@ class ConfigManager:
     CONFIG_FILE = "config.json"
     MAX_RECENT_PROJECTS = 10
 
+    # Last AppConfig parsed from disk: (path, mtime_ns, config)
+    _last_loaded: Optional[Tuple[str, int, AppConfig]] = None
+
     def __init__(self):
         self.config_dir = get_config_dir()
         self.config_file = self.config_dir / self.CONFIG_FILE
+        self._dirty = False
+        self._preset_cache: Dict[str, Tuple[int, BuildConfig]] = {}
+        self._preset_list_cache: Optional[Tuple[int, List[str]]] = None
         self.config = self._load_config()
 
     def _load_config(self) -> AppConfig:
         """Load configuration from file."""
-        if self.config_file.exists():
+        try:
+            mtime_ns = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return AppConfig()
+
+        path = str(self.config_file)
+        last = ConfigManager._last_loaded
+        if last is None or last[0] != path or last[1] != mtime_ns:
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return self._dict_to_config(data)
+                config = self._dict_to_config(_read_json(path, mtime_ns))
             except (json.JSONDecodeError, KeyError, TypeError):
                 return AppConfig()
-        return AppConfig()
+            last = ConfigManager._last_loaded = (path, mtime_ns, config)
+
+        # The cached config shares lists with the cached JSON; hand out a copy
+        return copy.deepcopy(last[2])
 
     def _dict_to_config(self, data: Dict[str, Any]) -> AppConfig:
         """Convert dictionary to AppConfig."""
@@ -85,6 +149,11 @@ class ConfigManager:
             python_interpreter=data.get('python_interpreter', ''),
             auto_open_output=data.get('auto_open_output', True),
             save_logs=data.get('save_logs', True),
+            parallel_install=data.get('parallel_install', 1),
+            max_log_blocks=data.get('max_log_blocks', 2000),
+            log_level=data.get('log_level', 'DEBUG'),
+            zip_compression=data.get('zip_compression', 'deflated'),
+            zip_compresslevel=data.get('zip_compresslevel', 6),
             build_config=BuildConfig(**build_data) if build_data else BuildConfig(),
             installer_config=InstallerConfig(**installer_data) if installer_data else InstallerConfig(),
             recent_projects=data.get('recent_projects', [])
@@ -92,6 +161,7 @@ class ConfigManager:
 
     def save(self):
         """Save configuration to file."""
+        self._dirty = False
         data = {
             'theme': self.config.theme,
             'last_script_dir': self.config.last_script_dir,
@@ -99,13 +169,17 @@ class ConfigManager:
             'python_interpreter': self.config.python_interpreter,
             'auto_open_output': self.config.auto_open_output,
             'save_logs': self.config.save_logs,
-            'build_config': asdict(self.config.build_config),
-            'installer_config': asdict(self.config.installer_config),
+            'parallel_install': self.config.parallel_install,
+            'max_log_blocks': self.config.max_log_blocks,
+            'log_level': self.config.log_level,
+            'zip_compression': self.config.zip_compression,
+            'zip_compresslevel': self.config.zip_compresslevel,
+            'build_config': _fast_asdict(self.config.build_config, _BUILD_FIELDS),
+            'installer_config': _fast_asdict(self.config.installer_config, _INSTALLER_FIELDS),
             'recent_projects': self.config.recent_projects
         }
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _write_json_atomic(self.config_file, data)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
@@ -115,6 +189,20 @@ class ConfigManager:
         """Set a configuration value."""
         if hasattr(self.config, key):
             setattr(self.config, key, value)
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        """Record unsaved changes; the caller decides when save_if_dirty runs."""
+        self._dirty = True
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are changes not yet written to disk."""
+        return self._dirty
+
+    def save_if_dirty(self):
+        """Write pending changes, if any."""
+        if self._dirty:
             self.save()
 
     def add_recent_project(self, path: str):
@@ -127,30 +215,49 @@ class ConfigManager:
 
     def save_preset(self, name: str, build_config: BuildConfig) -> Path:
         """Save a build preset."""
-        presets_dir = self.config_dir / "presets"
-        presets_dir.mkdir(exist_ok=True)
+        presets_dir = ensure_dir(self.config_dir / "presets")
 
         preset_file = presets_dir / f"{name}.json"
         with open(preset_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(build_config), f, indent=2)
+            json.dump(_fast_asdict(build_config, _BUILD_FIELDS), f, indent=2)
 
+        self._preset_cache.pop(preset_file.name, None)
+        self._preset_list_cache = None
         return preset_file
 
     def load_preset(self, name: str) -> Optional[BuildConfig]:
         """Load a build preset."""
         preset_file = self.config_dir / "presets" / f"{name}.json"
-        if preset_file.exists():
+        try:
+            mtime_ns = preset_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._preset_cache.pop(preset_file.name, None)
+            return None
+
+        cached = self._preset_cache.get(preset_file.name)
+        if cached is None or cached[0] != mtime_ns:
             with open(preset_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-            return BuildConfig(**data)
-        return None
+            cached = (mtime_ns, BuildConfig(**data))
+            self._preset_cache[preset_file.name] = cached
+
+        # Callers adopt the preset as their live config, so return a copy
+        return copy.deepcopy(cached[1])
 
     def list_presets(self) -> list:
         """List available presets."""
         presets_dir = self.config_dir / "presets"
-        if presets_dir.exists():
-            return [f.stem for f in presets_dir.glob("*.json")]
-        return []
+        try:
+            mtime_ns = presets_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        if self._preset_list_cache is None or self._preset_list_cache[0] != mtime_ns:
+            with os.scandir(presets_dir) as entries:
+                names = [e.name[:-5] for e in entries
+                         if e.name.endswith('.json') and e.is_file()]
+            self._preset_list_cache = (mtime_ns, names)
+        return list(self._preset_list_cache[1])
 
 
 # Global config manager instance
@@ -1,13 +1,16 @@
 """Logging system with Qt signal support for real-time UI updates."""
 
 import logging
-from datetime import datetime
-from typing import Optional
+import time
 from enum import Enum
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
 
+# Last formatted timestamp as (epoch second, "HH:MM:SS")
+_ts_cache = (0, "")
+
+
 class LogLevel(Enum):
     """Log level enumeration."""
     DEBUG = "DEBUG"
@@ -17,21 +20,28 @@ class LogLevel(Enum):
     SUCCESS = "SUCCESS"
 
 
+# Stdlib logging level used for each LogLevel
+_LEVEL_TO_STD = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+    LogLevel.SUCCESS: logging.INFO,
+}
+
+
 class LogEmitter(QObject):
     """Qt signal emitter for log messages."""
     log_message = pyqtSignal(str, str)  # message, level
     build_output = pyqtSignal(str)  # raw build output
 
 
-# Global emitter instance
-_emitter: Optional[LogEmitter] = None
+# Global emitter instance, created once at import time
+_emitter: LogEmitter = LogEmitter()
 
 
 def get_emitter() -> LogEmitter:
-    """Get or create the global log emitter."""
-    global _emitter
-    if _emitter is None:
-        _emitter = LogEmitter()
+    """Get the global log emitter."""
     return _emitter
 
 
@@ -41,6 +51,12 @@ class AppLogger:
     def __init__(self, name: str = "PyInstallerBuilder"):
         self.name = name
         self.emitter = get_emitter()
+        # Bound once so per-line emits skip the signal attribute lookup
+        self._emit_signal = self.emitter.log_message.emit
+        # Pre-rendered "[LEVEL]" tag per level
+        self._level_tags = {level: f"[{level.value}]" for level in LogLevel}
+        # Messages below this stdlib level are not sent to the UI
+        self._min_level = logging.DEBUG
         self._setup_file_logger()
 
     def _setup_file_logger(self):
@@ -60,51 +76,71 @@ class AppLogger:
 
     def _format_message(self, message: str, level: LogLevel) -> str:
         """Format a log message with timestamp."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        return f"[{timestamp}] [{level.value}] {message}"
-
-    def _emit(self, message: str, level: LogLevel):
-        """Emit a log message through Qt signal."""
-        formatted = self._format_message(message, level)
-        self.emitter.log_message.emit(formatted, level.value)
+        global _ts_cache
+        now = int(time.time())
+        if now != _ts_cache[0]:
+            _ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        timestamp = _ts_cache[1]
+        return f"[{timestamp}] {self._level_tags[level]} {message}"
+
+    def set_level(self, name: str):
+        """Stop sending messages below the named level, e.g. "INFO", to the UI.
+
+        The stdlib logger (and saved log files) still receive everything.
+        """
+        try:
+            self._min_level = _LEVEL_TO_STD[LogLevel(name.upper())]
+        except ValueError:
+            self._min_level = logging.DEBUG
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Whether either sink would use a message at this level.
+
+        Lets callers skip building messages in hot loops.
+        """
+        std_level = _LEVEL_TO_STD[level]
+        return std_level >= self._min_level or self.logger.isEnabledFor(std_level)
+
+    def _log(self, message: str, level: LogLevel):
+        """Send a message to the stdlib logger and the UI signal."""
+        std_level = _LEVEL_TO_STD[level]
+        if self.logger.isEnabledFor(std_level):
+            if level is LogLevel.SUCCESS:
+                self.logger.log(std_level, f"SUCCESS: {message}")
+            else:
+                self.logger.log(std_level, message)
+        if std_level >= self._min_level:
+            self._emit_signal(self._format_message(message, level), level.value)
 
     def debug(self, message: str):
         """Log a debug message."""
-        self.logger.debug(message)
-        self._emit(message, LogLevel.DEBUG)
+        self._log(message, LogLevel.DEBUG)
 
     def info(self, message: str):
         """Log an info message."""
-        self.logger.info(message)
-        self._emit(message, LogLevel.INFO)
+        self._log(message, LogLevel.INFO)
 
     def warning(self, message: str):
         """Log a warning message."""
-        self.logger.warning(message)
-        self._emit(message, LogLevel.WARNING)
+        self._log(message, LogLevel.WARNING)
 
     def error(self, message: str):
         """Log an error message."""
-        self.logger.error(message)
-        self._emit(message, LogLevel.ERROR)
+        self._log(message, LogLevel.ERROR)
 
     def success(self, message: str):
         """Log a success message."""
-        self.logger.info(f"SUCCESS: {message}")
-        self._emit(message, LogLevel.SUCCESS)
+        self._log(message, LogLevel.SUCCESS)
 
     def build_output(self, line: str):
         """Emit raw build output."""
         self.emitter.build_output.emit(line)
 
 
-# Global logger instance
-_app_logger: Optional[AppLogger] = None
+# Global logger instance, created once at import time
+_app_logger: AppLogger = AppLogger()
 
 
 def get_logger() -> AppLogger:
-    """Get or create the global application logger."""
-    global _app_logger
-    if _app_logger is None:
-        _app_logger = AppLogger()
+    """Get the global application logger."""
     return _app_logger
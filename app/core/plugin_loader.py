@@ -1,16 +1,24 @@
 """Plugin system for extensible build processors and post-build tasks."""
 
 import importlib.util
-import inspect
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Type
+from types import ModuleType
+from typing import List, Dict, Any, Optional, Tuple, Type
 from dataclasses import dataclass
 
 from app.utils.paths import get_plugins_dir
 from app.core.logger import get_logger
 
 
+# Plugin classes registered by PluginBase.__init_subclass__ as they are defined
+_PLUGIN_REGISTRY: List[type] = []
+
+# Executed plugin modules keyed by file path: (mtime_ns, module, plugin classes)
+_module_cache: Dict[Path, Tuple[int, ModuleType, List[type]]] = {}
+
+
 @dataclass
 class PluginInfo:
     """Information about a loaded plugin."""
@@ -32,6 +40,14 @@ class PluginBase(ABC):
     AUTHOR = "Unknown"
     PLUGIN_TYPE = "post_build"  # 'build_processor' or 'post_build'
 
+    # Intermediate base classes set this in their own body to stay unregistered
+    _ABSTRACT = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.__dict__.get('_ABSTRACT', False):
+            _PLUGIN_REGISTRY.append(cls)
+
     def __init__(self):
         self.logger = get_logger()
 
@@ -67,6 +83,7 @@ class BuildProcessorPlugin(PluginBase):
     """Base class for build processor plugins that modify the build process."""
 
     PLUGIN_TYPE = "build_processor"
+    _ABSTRACT = True
 
     @abstractmethod
     def pre_build(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -103,6 +120,7 @@ class PostBuildPlugin(PluginBase):
     """Base class for post-build task plugins."""
 
     PLUGIN_TYPE = "post_build"
+    _ABSTRACT = True
 
 
 class PluginLoader:
@@ -112,6 +130,12 @@ class PluginLoader:
         self.plugins_dir = plugins_dir or get_plugins_dir()
         self.logger = get_logger()
         self.plugins: Dict[str, PluginBase] = {}
+
+        # Pre-filtered views of self.plugins, rebuilt whenever plugins load
+        self._by_type: Dict[str, List[PluginBase]] = {}
+        self._build_processors: List[BuildProcessorPlugin] = []
+        self._post_build: List[PostBuildPlugin] = []
+
         self._load_plugins()
 
     def _load_plugins(self):
@@ -119,36 +143,64 @@ class PluginLoader:
         if not self.plugins_dir.exists():
             self.plugins_dir.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"Created plugins directory: {self.plugins_dir}")
+            self._index_plugins()
             return
 
-        for plugin_file in self.plugins_dir.glob("*.py"):
-            if plugin_file.name.startswith("_"):
-                continue
+        with os.scandir(self.plugins_dir) as entries:
+            plugin_paths = [e.path for e in entries
+                            if e.name.endswith(".py") and not e.name.startswith("_")
+                            and e.is_file()]
 
+        for plugin_path in plugin_paths:
+            plugin_file = Path(plugin_path)
             try:
                 self._load_plugin_file(plugin_file)
             except Exception as e:
                 self.logger.error(f"Failed to load plugin {plugin_file.name}: {str(e)}")
 
+        self._index_plugins()
+
+    def _index_plugins(self):
+        """Rebuild the per-type plugin lists from self.plugins."""
+        self._by_type = {'build_processor': [], 'post_build': []}
+        self._build_processors = []
+        self._post_build = []
+        for plugin in self.plugins.values():
+            self._by_type.setdefault(plugin.PLUGIN_TYPE, []).append(plugin)
+            if isinstance(plugin, BuildProcessorPlugin):
+                self._build_processors.append(plugin)
+            if isinstance(plugin, PostBuildPlugin):
+                self._post_build.append(plugin)
+
     def _load_plugin_file(self, file_path: Path):
         """Load a single plugin file."""
-        spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
-        if spec is None or spec.loader is None:
-            return
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        mtime_ns = file_path.stat().st_mtime_ns
+        cached = _module_cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns:
+            plugin_classes = cached[2]
+        else:
+            spec = importlib.util.spec_from_file_location(file_path.stem, file_path)
+            if spec is None or spec.loader is None:
+                return
+
+            module = importlib.util.module_from_spec(spec)
+
+            # Classes defined while the module executes land in the registry
+            start = len(_PLUGIN_REGISTRY)
+            try:
+                spec.loader.exec_module(module)
+                plugin_classes = _PLUGIN_REGISTRY[start:]
+            finally:
+                del _PLUGIN_REGISTRY[start:]
+            _module_cache[file_path] = (mtime_ns, module, plugin_classes)
 
-        # Find plugin classes in the module
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if (issubclass(obj, PluginBase) and
-                obj not in (PluginBase, BuildProcessorPlugin, PostBuildPlugin)):
-                try:
-                    plugin_instance = obj()
-                    self.plugins[plugin_instance.NAME] = plugin_instance
-                    self.logger.info(f"Loaded plugin: {plugin_instance.NAME}")
-                except Exception as e:
-                    self.logger.error(f"Failed to instantiate plugin {name}: {str(e)}")
+        for cls in plugin_classes:
+            try:
+                plugin_instance = cls()
+                self.plugins[plugin_instance.NAME] = plugin_instance
+                self.logger.info(f"Loaded plugin: {plugin_instance.NAME}")
+            except Exception as e:
+                self.logger.error(f"Failed to instantiate plugin {cls.__name__}: {str(e)}")
 
     def get_plugin(self, name: str) -> Optional[PluginBase]:
         """Get a plugin by name."""
@@ -160,15 +212,15 @@ class PluginLoader:
 
     def get_plugins_by_type(self, plugin_type: str) -> List[PluginBase]:
         """Get plugins of a specific type."""
-        return [p for p in self.plugins.values() if p.PLUGIN_TYPE == plugin_type]
+        return list(self._by_type.get(plugin_type, ()))
 
     def get_build_processors(self) -> List[BuildProcessorPlugin]:
         """Get all build processor plugins."""
-        return [p for p in self.plugins.values() if isinstance(p, BuildProcessorPlugin)]
+        return list(self._build_processors)
 
     def get_post_build_plugins(self) -> List[PostBuildPlugin]:
         """Get all post-build plugins."""
-        return [p for p in self.plugins.values() if isinstance(p, PostBuildPlugin)]
+        return list(self._post_build)
 
     def execute_plugin(self, name: str, context: Dict[str, Any]) -> bool:
         """Execute a plugin by name."""
@@ -184,14 +236,20 @@ class PluginLoader:
     def execute_post_build_plugins(self, context: Dict[str, Any]) -> Dict[str, bool]:
         """Execute all enabled post-build plugins."""
         results = {}
-        for plugin in self.get_post_build_plugins():
+        for plugin in self._post_build:
             info = plugin.get_info()
             if info.enabled:
                 results[plugin.NAME] = self.execute_plugin(plugin.NAME, context)
         return results
 
-    def reload_plugins(self):
-        """Reload all plugins from disk."""
+    def reload_plugins(self, force: bool = False):
+        """Reload all plugins from disk.
+
+        Unchanged plugin files are reused from the module cache unless
+        ``force`` is set.
+        """
+        if force:
+            _module_cache.clear()
         self.plugins.clear()
         self._load_plugins()
 
@@ -2,17 +2,19 @@
 
 import sys
 import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Callable
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from app.utils.paths import get_config_dir, ensure_dir
+from app.utils.compat import DATACLASS_SLOTS
+from app.utils.shell import run_command
 
-from app.core.logger import get_logger
-from app.utils.shell import run_command, run_command_stream, ProcessResult
 
-
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class VenvInfo:
     """Information about a virtual environment."""
     path: Path
@@ -22,116 +24,46 @@ class VenvInfo:
     python_version: str = ""
 
 
-class VenvWorker(QThread):
-    """Worker thread for venv operations."""
-
-    output_line = pyqtSignal(str)
-    operation_finished = pyqtSignal(bool, str)  # success, message
-    progress = pyqtSignal(str)  # status message
-
-    def __init__(self, operation: str, venv_path: Path, requirements_path: Optional[Path] = None):
-        super().__init__()
-        self.operation = operation
-        self.venv_path = venv_path
-        self.requirements_path = requirements_path
-        self.logger = get_logger()
-
-    def run(self):
-        """Execute the venv operation."""
-        if self.operation == "create":
-            self._create_venv()
-        elif self.operation == "install":
-            self._install_requirements()
-        elif self.operation == "delete":
-            self._delete_venv()
-
-    def _create_venv(self):
-        """Create a new virtual environment."""
-        try:
-            self.progress.emit("Creating virtual environment...")
-            self.output_line.emit(f"Creating venv at: {self.venv_path}")
-
-            cmd = [sys.executable, "-m", "venv", str(self.venv_path)]
-
-            def output_callback(line: str):
-                self.output_line.emit(line)
-
-            result = run_command_stream(cmd, output_callback)
-
-            if result.success:
-                self.logger.success("Virtual environment created successfully")
-                self.operation_finished.emit(True, "Virtual environment created")
-            else:
-                self.logger.error(f"Failed to create venv: {result.stderr}")
-                self.operation_finished.emit(False, f"Failed: {result.stderr}")
-
-        except Exception as e:
-            self.logger.error(f"Venv creation error: {str(e)}")
-            self.operation_finished.emit(False, str(e))
-
-    def _install_requirements(self):
-        """Install requirements in the virtual environment."""
-        try:
-            if not self.requirements_path or not self.requirements_path.exists():
-                self.operation_finished.emit(False, "Requirements file not found")
-                return
-
-            self.progress.emit("Installing requirements...")
-
-            # Get pip path
-            if sys.platform == 'win32':
-                pip_path = self.venv_path / "Scripts" / "pip.exe"
-            else:
-                pip_path = self.venv_path / "bin" / "pip"
-
-            if not pip_path.exists():
-                self.operation_finished.emit(False, "Pip not found in virtual environment")
-                return
-
-            cmd = [str(pip_path), "install", "-r", str(self.requirements_path)]
-
-            def output_callback(line: str):
-                self.output_line.emit(line)
-
-            result = run_command_stream(cmd, output_callback)
-
-            if result.success:
-                self.logger.success("Requirements installed successfully")
-                self.operation_finished.emit(True, "Requirements installed")
-            else:
-                self.logger.error(f"Failed to install requirements: {result.stderr}")
-                self.operation_finished.emit(False, f"Failed: {result.stderr}")
-
-        except Exception as e:
-            self.logger.error(f"Requirements installation error: {str(e)}")
-            self.operation_finished.emit(False, str(e))
-
-    def _delete_venv(self):
-        """Delete the virtual environment."""
-        import shutil
-        try:
-            self.progress.emit("Deleting virtual environment...")
-
-            if self.venv_path.exists():
-                shutil.rmtree(self.venv_path)
-                self.logger.success("Virtual environment deleted")
-                self.operation_finished.emit(True, "Virtual environment deleted")
-            else:
-                self.operation_finished.emit(False, "Virtual environment not found")
-
-        except Exception as e:
-            self.logger.error(f"Venv deletion error: {str(e)}")
-            self.operation_finished.emit(False, str(e))
+class VenvManager:
+    """Manages virtual environments for builds.
 
+    Qt-free: only inspects venvs. QtVenvManager (app.core.venv_worker) adds
+    the background create/install/delete operations.
+    """
 
-class VenvManager:
-    """Manages virtual environments for builds."""
+    # Upper bound on concurrent `python --version` probes in list_venvs
+    MAX_PROBE_WORKERS = 8
+    # Directory under base_path holding venv templates (not listed as a venv)
+    CACHE_DIR_NAME = ".cache"
 
     def __init__(self, base_path: Optional[Path] = None):
-        self.base_path = base_path or Path.home() / ".pyinstaller_builder" / "venvs"
-        self.base_path.mkdir(parents=True, exist_ok=True)
-        self.logger = get_logger()
-        self.current_worker: Optional[VenvWorker] = None
+        self.base_path = ensure_dir(base_path or Path.home() / ".pyinstaller_builder" / "venvs")
+        # One lock per venv name, so operations on the same venv never overlap
+        self._name_locks: Dict[str, threading.Lock] = {}
+        self._name_locks_guard = threading.Lock()
+        # VenvInfo per venv path, valid while the interpreter's mtime_ns matches
+        self._info_cache: Dict[Path, Tuple[int, VenvInfo]] = {}
+        # Interpreter list, valid while base_path's mtime_ns matches
+        self._interp_cache: Optional[Tuple[int, List[str]]] = None
+        # Download/wheel cache and local wheelhouse shared by all venvs
+        self.pip_cache = ensure_dir(get_config_dir() / "pip-cache")
+        self.wheelhouse = ensure_dir(get_config_dir() / "wheels")
+
+    @property
+    def _template_dir(self) -> Path:
+        """Pristine venv for the current interpreter, copied by create_venv.
+
+        Keyed on the interpreter's path, version and mtime, so upgrading
+        Python in place (same path) builds a fresh template.
+        """
+        try:
+            mtime_ns = os.stat(sys.executable).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        key = hashlib.blake2b(
+            f"{sys.executable}\0{sys.version}\0{mtime_ns}".encode(), digest_size=8
+        ).hexdigest()
+        return self.base_path / self.CACHE_DIR_NAME / key
 
     def get_venv_info(self, name: str) -> VenvInfo:
         """Get information about a virtual environment."""
@@ -144,94 +76,73 @@ class VenvManager:
             python_path = venv_path / "bin" / "python"
             pip_path = venv_path / "bin" / "pip"
 
-        exists = venv_path.exists() and python_path.exists()
+        try:
+            mtime_ns = python_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        exists = mtime_ns is not None
+
+        if exists:
+            cached = self._info_cache.get(venv_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
 
         python_version = ""
         if exists:
-            result = run_command([str(python_path), "--version"])
+            # Single short line; skip building a text-mode pipe for it
+            result = run_command([str(python_path), "-V"], text=False)
             if result.success:
-                python_version = result.stdout.strip()
+                python_version = result.stdout.strip().decode('utf-8', 'replace')
 
-        return VenvInfo(
+        info = VenvInfo(
             path=venv_path,
             python_path=python_path,
             pip_path=pip_path,
             exists=exists,
             python_version=python_version
         )
+        if exists:
+            self._info_cache[venv_path] = (mtime_ns, info)
+        else:
+            self._info_cache.pop(venv_path, None)
+        return info
 
-    def create_venv(
-        self,
-        name: str,
-        on_output: Optional[Callable[[str], None]] = None,
-        on_finished: Optional[Callable[[bool, str], None]] = None,
-        on_progress: Optional[Callable[[str], None]] = None
-    ) -> VenvWorker:
-        """Create a new virtual environment."""
-        venv_path = self.base_path / name
-
-        self.current_worker = VenvWorker("create", venv_path)
-
-        if on_output:
-            self.current_worker.output_line.connect(on_output)
-        if on_finished:
-            self.current_worker.operation_finished.connect(on_finished)
-        if on_progress:
-            self.current_worker.progress.connect(on_progress)
-
-        self.current_worker.start()
-        return self.current_worker
-
-    def install_requirements(
-        self,
-        name: str,
-        requirements_path: Path,
-        on_output: Optional[Callable[[str], None]] = None,
-        on_finished: Optional[Callable[[bool, str], None]] = None,
-        on_progress: Optional[Callable[[str], None]] = None
-    ) -> VenvWorker:
-        """Install requirements in a virtual environment."""
-        venv_path = self.base_path / name
-
-        self.current_worker = VenvWorker("install", venv_path, requirements_path)
-
-        if on_output:
-            self.current_worker.output_line.connect(on_output)
-        if on_finished:
-            self.current_worker.operation_finished.connect(on_finished)
-        if on_progress:
-            self.current_worker.progress.connect(on_progress)
-
-        self.current_worker.start()
-        return self.current_worker
-
-    def delete_venv(
-        self,
-        name: str,
-        on_finished: Optional[Callable[[bool, str], None]] = None
-    ) -> VenvWorker:
-        """Delete a virtual environment."""
-        venv_path = self.base_path / name
-
-        self.current_worker = VenvWorker("delete", venv_path)
-
-        if on_finished:
-            self.current_worker.operation_finished.connect(on_finished)
+    def invalidate(self, name: str):
+        """Drop cached information for a virtual environment."""
+        self._info_cache.pop(self.base_path / name, None)
+        # Coarse directory mtimes (e.g. FAT32) may not reflect the change
+        self._interp_cache = None
 
-        self.current_worker.start()
-        return self.current_worker
+    def _name_lock(self, name: str) -> threading.Lock:
+        """Return the in-process lock for a venv name."""
+        with self._name_locks_guard:
+            return self._name_locks.setdefault(name, threading.Lock())
 
     def list_venvs(self) -> List[VenvInfo]:
         """List all virtual environments."""
-        venvs = []
-        if self.base_path.exists():
-            for item in self.base_path.iterdir():
-                if item.is_dir():
-                    venvs.append(self.get_venv_info(item.name))
-        return venvs
+        if not self.base_path.exists():
+            return []
+
+        with os.scandir(self.base_path) as entries:
+            names = [e.name for e in entries if e.is_dir() and not e.name.startswith('.')]
+        if not names:
+            return []
+
+        # Version probes are subprocess waits, so they overlap well in threads
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PROBE_WORKERS, len(names))) as executor:
+            return list(executor.map(self.get_venv_info, names))
 
     def get_python_interpreters(self) -> List[str]:
         """Get list of available Python interpreters."""
+        try:
+            mtime_ns = os.stat(self.base_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        cached = self._interp_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+
         interpreters = [sys.executable]
 
         # Add venv interpreters
@@ -239,4 +150,14 @@ class VenvManager:
             if venv.exists:
                 interpreters.append(str(venv.python_path))
 
-        return interpreters
+        if mtime_ns is not None:
+            self._interp_cache = (mtime_ns, interpreters)
+        return list(interpreters)
+
+
+def __getattr__(name: str):
+    """Resolve the Qt-based names lazily, keeping this module Qt-free."""
+    if name in ("VenvTask", "VenvWorker", "QtVenvManager"):
+        from app.core import venv_worker
+        return getattr(venv_worker, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,593 @@
+"""Background virtual environment operations (Qt)."""
+
+import sys
+import os
+import hashlib
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, Dict, List, Callable, Tuple
+
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from app.core.config_manager import get_config_manager
+from app.core.logger import get_logger
+from app.core.venv_manager import VenvManager
+from app.utils.fs_fast import rmtree_fast
+from app.utils.paths import ensure_dir
+from app.utils.shell import run_command_stream, ProcessResult
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """Hold an exclusive OS-level lock on ``lock_path`` (shared across processes)."""
+    ensure_dir(lock_path.parent)
+    with open(lock_path, 'wb') as f:
+        if sys.platform == 'win32':
+            while True:
+                try:
+                    # LK_LOCK itself gives up after ~10 s of retries
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _lock_path_for(path: Path) -> Path:
+    """Sidecar lock file next to ``path`` (a suffix would clash with names like py3.10)."""
+    return path.parent / (path.name + ".lock")
+
+
+def _venv_scripts_dir(venv_path: Path) -> Path:
+    """Return the directory holding a venv's interpreter and entry points."""
+    return venv_path / ("Scripts" if sys.platform == 'win32' else "bin")
+
+
+def _rewrite_venv_paths(venv_path: Path, old_path: Path):
+    """Point a copied venv's config, activate scripts and launchers at ``venv_path``."""
+    old = os.fsencode(str(old_path))
+    new = os.fsencode(str(venv_path))
+
+    targets = [venv_path / "pyvenv.cfg"]
+    with os.scandir(_venv_scripts_dir(venv_path)) as entries:
+        targets.extend(Path(e.path) for e in entries if e.is_file(follow_symlinks=False))
+
+    for target in targets:
+        data = target.read_bytes()
+        if old in data:
+            target.write_bytes(data.replace(old, new))
+
+
+# A spec line carrying options, e.g. "pkg==1.0 --hash=sha256:..."
+_INLINE_OPTION_RE = re.compile(r'\s-')
+
+
+def _parse_requirements(path: Path) -> Optional[List[str]]:
+    """Return the package specs in a plain requirements file.
+
+    Comments and blank lines are skipped. Returns None when the file uses
+    option lines (``-r``, ``-e``, ``--index-url``, ``-c``, ...), inline
+    options such as ``--hash`` or backslash continuations: only pip reading
+    the whole file keeps their meaning, so such files are not sharded.
+    """
+    specs = []
+    for line in path.read_text(encoding='utf-8', errors='replace').splitlines():
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith('#'):
+            continue
+        if (line.startswith('-') or line.endswith('\\')
+                or _INLINE_OPTION_RE.search(line)):
+            return None
+        specs.append(line)
+    # Duplicates in different shards would race on the same install
+    return list(dict.fromkeys(specs))
+
+
+def _write_text_atomic(path: Path, text: str):
+    """Write ``text`` to ``path`` via a temp file and os.replace."""
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class VenvTaskSignals(QObject):
+    """Signals of a VenvTask; QRunnable itself is not a QObject."""
+
+    output_line = pyqtSignal(str)  # one or more newline-separated lines
+    operation_finished = pyqtSignal(bool, str)  # success, message
+    progress = pyqtSignal(str)  # status message
+
+
+class VenvTask(QRunnable):
+    """Venv operation run on a thread pool.
+
+    Signals are on ``self.signals``, created with the task on the GUI
+    thread. The pool owns the runnable and deletes it after run().
+    """
+
+    # Subprocess output is emitted in batches of up to this many lines...
+    FLUSH_LINES = 64
+    # ...or at least this often (seconds)
+    FLUSH_INTERVAL = 0.032
+
+    # Marks a venv template as fully created
+    TEMPLATE_MARKER = ".template_complete"
+    # Requirements files with at most this many specs are never sharded
+    MIN_SHARD_SPECS = 4
+    # Upper bound on concurrent pip processes for a sharded install
+    MAX_INSTALL_WORKERS = 4
+    # Sidecar recording the requirements hash of the last successful install
+    INSTALLED_HASH_FILE = ".pib_installed_hash"
+    # Seconds to wait for a terminated subprocess before killing it
+    TERMINATE_TIMEOUT = 2
+
+    def __init__(
+        self,
+        operation: str,
+        venv_path: Path,
+        requirements_path: Optional[Path] = None,
+        template_dir: Optional[Path] = None,
+        parallel_install: int = 1,
+        pip_cache: Optional[Path] = None,
+        wheelhouse: Optional[Path] = None,
+        venv_lock: Optional[threading.Lock] = None
+    ):
+        super().__init__()
+        self.signals = VenvTaskSignals()
+        self.operation = operation
+        self.venv_path = venv_path
+        self.requirements_path = requirements_path
+        self.template_dir = template_dir
+        self.parallel_install = parallel_install
+        self.pip_cache = pip_cache
+        self.wheelhouse = wheelhouse
+        # Serializes operations on this venv within the process
+        self.venv_lock = venv_lock or threading.Lock()
+        self.logger = get_logger()
+        self._line_buf: List[str] = []
+        self._last_flush = time.monotonic()
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        # Running subprocesses (several during a sharded install)
+        self._procs: List[subprocess.Popen] = []
+        self._procs_lock = threading.Lock()
+
+    def cancel(self):
+        """Request cancellation without blocking the caller.
+
+        Running subprocesses are stopped from a background thread, so the
+        GUI never waits out their termination timeout.
+        """
+        self._cancelled.set()
+        with self._procs_lock:
+            procs = list(self._procs)
+        if procs:
+            threading.Thread(
+                target=self._stop_processes, args=(procs,),
+                name="venv-task-cancel", daemon=True
+            ).start()
+
+    def is_running(self) -> bool:
+        """Whether the task has not finished yet."""
+        return not self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the task finishes; False if ``timeout`` expired first."""
+        return self._done.wait(timeout)
+
+    def _on_process_started(self, process: subprocess.Popen):
+        """Track the process handle so cancel() can stop it."""
+        with self._procs_lock:
+            self._procs.append(process)
+        # cancel() may have run before the process existed
+        if self._cancelled.is_set():
+            self._stop_process(process)
+
+    def _stop_process(self, proc: subprocess.Popen):
+        """Terminate a subprocess, killing it if needed."""
+        self._stop_processes([proc])
+
+    def _stop_processes(self, procs: List[subprocess.Popen]):
+        """Terminate subprocesses, killing any still running after TERMINATE_TIMEOUT."""
+        running = [proc for proc in procs if proc.poll() is None]
+        for proc in running:
+            proc.terminate()
+        deadline = time.monotonic() + self.TERMINATE_TIMEOUT
+        for proc in running:
+            try:
+                proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    def _stream(self, cmd: List[str], output_callback: Callable[[str], None],
+                env: Optional[Dict[str, str]] = None) -> ProcessResult:
+        """Run a command through run_command_stream with cancellation support."""
+        if self._cancelled.is_set():
+            return ProcessResult(return_code=-1, stdout="", stderr="Cancelled", success=False)
+        return run_command_stream(
+            cmd,
+            output_callback,
+            env=env,
+            process_callback=self._on_process_started,
+            collapse_duplicates=True
+        )
+
+    def _buffer_line(self, line: str):
+        """Queue a line of subprocess output, flushing when a batch is due."""
+        self._line_buf.append(line)
+        if (len(self._line_buf) >= self.FLUSH_LINES or
+                time.monotonic() - self._last_flush > self.FLUSH_INTERVAL):
+            self._flush_lines()
+
+    def _flush_lines(self):
+        """Emit all queued output lines as one signal."""
+        if self._line_buf:
+            self.signals.output_line.emit("\n".join(self._line_buf))
+            self._line_buf.clear()
+        self._last_flush = time.monotonic()
+
+    def run(self):
+        """Execute the venv operation."""
+        try:
+            # Other tasks and app instances touching this venv wait their turn
+            with self.venv_lock, _file_lock(_lock_path_for(self.venv_path)):
+                if self.operation == "create":
+                    self._create_venv()
+                elif self.operation == "install":
+                    self._install_requirements()
+                elif self.operation == "delete":
+                    self._delete_venv()
+                else:
+                    self.signals.operation_finished.emit(
+                        False, f"Unknown operation: {self.operation}"
+                    )
+        except Exception as e:
+            # Taking the locks failed; the operations report their own errors
+            self.logger.error(f"Venv {self.operation} error: {str(e)}")
+            self.signals.operation_finished.emit(False, str(e))
+        finally:
+            self._done.set()
+
+    def _create_venv(self):
+        """Create a new virtual environment."""
+        try:
+            self.signals.progress.emit("Creating virtual environment...")
+            self.signals.output_line.emit(f"Creating venv at: {self.venv_path}")
+
+            result = None
+            if self.template_dir is not None:
+                result = self._create_from_template()
+
+            if result is None:
+                cmd = [sys.executable, "-m", "venv", str(self.venv_path)]
+
+                result = self._stream(cmd, self._buffer_line)
+                self._flush_lines()
+
+            if result.success:
+                self.logger.success("Virtual environment created successfully")
+                self.signals.operation_finished.emit(True, "Virtual environment created")
+            else:
+                self.logger.error(f"Failed to create venv: {result.stderr}")
+                self.signals.operation_finished.emit(False, f"Failed: {result.stderr}")
+
+        except Exception as e:
+            self.logger.error(f"Venv creation error: {str(e)}")
+            self.signals.operation_finished.emit(False, str(e))
+
+    def _pip_env(self) -> Dict[str, str]:
+        """Environment for pip runs: shared caches, no prompts or version checks."""
+        env = dict(os.environ)
+        env["PIP_DISABLE_PIP_VERSION_CHECK"] = "1"
+        env["PIP_NO_INPUT"] = "1"
+        if self.pip_cache is not None:
+            env["PIP_CACHE_DIR"] = str(self.pip_cache)
+        if self.wheelhouse is not None:
+            env["PIP_FIND_LINKS"] = str(self.wheelhouse)
+        return env
+
+    def _pip_install_args(self, pip_path: Path) -> List[str]:
+        """Common leading argv for ``pip install``."""
+        args = [str(pip_path), "install", "--prefer-binary"]
+        if self.pip_cache is not None:
+            args += ["--cache-dir", str(self.pip_cache)]
+        return args
+
+    def _create_from_template(self) -> Optional[ProcessResult]:
+        """Create the venv by copying a cached template.
+
+        Returns None when the template cannot be used, so the caller falls
+        back to a regular ``python -m venv``.
+        """
+        if self.venv_path.exists():
+            # Let python -m venv update an existing environment in place
+            return None
+
+        template_dir = self.template_dir
+        marker = template_dir / self.TEMPLATE_MARKER
+
+        # Creates of different venvs share the template; build it only once
+        with _file_lock(_lock_path_for(template_dir)):
+            if not marker.exists():
+                self.signals.output_line.emit(f"Creating venv template at: {template_dir}")
+                if template_dir.exists():
+                    # Left over from an interrupted template build
+                    rmtree_fast(template_dir)
+                cmd = [sys.executable, "-m", "venv", str(template_dir)]
+                result = self._stream(cmd, self._buffer_line)
+                self._flush_lines()
+                if not result.success:
+                    self.logger.warning(f"Failed to create venv template: {result.stderr}")
+                    return None
+                marker.touch()
+
+        try:
+            shutil.copytree(
+                template_dir,
+                self.venv_path,
+                symlinks=True,
+                ignore=shutil.ignore_patterns(self.TEMPLATE_MARKER)
+            )
+            _rewrite_venv_paths(self.venv_path, template_dir)
+        except OSError as e:
+            self.logger.warning(f"Venv template copy failed, creating from scratch: {e}")
+            if self.venv_path.exists():
+                rmtree_fast(self.venv_path)
+            return None
+
+        self.signals.output_line.emit("Copied from cached venv template")
+        return ProcessResult(return_code=0, stdout="", stderr="", success=True)
+
+    def _install_requirements(self):
+        """Install requirements in the virtual environment."""
+        try:
+            if not self.requirements_path or not self.requirements_path.exists():
+                self.signals.operation_finished.emit(False, "Requirements file not found")
+                return
+
+            self.signals.progress.emit("Installing requirements...")
+
+            # Get pip path
+            if sys.platform == 'win32':
+                pip_path = self.venv_path / "Scripts" / "pip.exe"
+            else:
+                pip_path = self.venv_path / "bin" / "pip"
+
+            if not pip_path.exists():
+                self.signals.operation_finished.emit(False, "Pip not found in virtual environment")
+                return
+
+            req_hash = hashlib.blake2b(
+                self.requirements_path.read_bytes(), digest_size=16
+            ).hexdigest()
+            hash_file = self.venv_path / self.INSTALLED_HASH_FILE
+            try:
+                if hash_file.read_text(encoding='utf-8') == req_hash:
+                    self.logger.info("Requirements unchanged since last install, skipping")
+                    self.signals.operation_finished.emit(True, "Requirements already installed")
+                    return
+            except OSError:
+                pass
+
+            env = self._pip_env()
+            install_args = self._pip_install_args(pip_path)
+
+            if self.parallel_install > 1:
+                result = self._install_sharded(install_args, env)
+                if not result.success:
+                    self.logger.error(f"Failed to install requirements: {result.stderr}")
+                    self.signals.operation_finished.emit(False, f"Failed: {result.stderr}")
+                    return
+
+            # Resolves and installs dependencies; near no-op after a sharded pass
+            cmd = install_args + ["-r", str(self.requirements_path)]
+
+            result = self._stream(cmd, self._buffer_line, env=env)
+            self._flush_lines()
+
+            if result.success:
+                _write_text_atomic(hash_file, req_hash)
+                self.logger.success("Requirements installed successfully")
+                self.signals.operation_finished.emit(True, "Requirements installed")
+            else:
+                self.logger.error(f"Failed to install requirements: {result.stderr}")
+                self.signals.operation_finished.emit(False, f"Failed: {result.stderr}")
+
+        except Exception as e:
+            self.logger.error(f"Requirements installation error: {str(e)}")
+            self.signals.operation_finished.emit(False, str(e))
+
+    def _install_sharded(self, install_args: List[str], env: Dict[str, str]) -> ProcessResult:
+        """Install the top-level specs with several concurrent ``pip --no-deps`` runs."""
+        specs = _parse_requirements(self.requirements_path)
+        if specs is None:
+            self.signals.output_line.emit(
+                "Requirements use pip options, installing them in one pass"
+            )
+            return ProcessResult(return_code=0, stdout="", stderr="", success=True)
+        if len(specs) <= self.MIN_SHARD_SPECS:
+            return ProcessResult(return_code=0, stdout="", stderr="", success=True)
+
+        shard_count = min(self.parallel_install, self.MAX_INSTALL_WORKERS, len(specs))
+        self.signals.output_line.emit(f"Installing {len(specs)} requirements in {shard_count} shards")
+
+        # Shards stream concurrently, so serialize access to the line buffer
+        lock = threading.Lock()
+
+        def on_line(line: str):
+            with lock:
+                self._buffer_line(line)
+
+        with tempfile.TemporaryDirectory(prefix="pib_shards_") as shard_dir:
+            commands = []
+            for i in range(shard_count):
+                shard_file = Path(shard_dir) / f"shard_{i}.txt"
+                shard_file.write_text("\n".join(specs[i::shard_count]) + "\n", encoding='utf-8')
+                commands.append(install_args + ["--no-deps", "-r", str(shard_file)])
+
+            with ThreadPoolExecutor(max_workers=shard_count) as executor:
+                results = list(executor.map(
+                    lambda cmd: self._stream(cmd, on_line, env=env), commands
+                ))
+
+        self._flush_lines()
+        for result in results:
+            if not result.success:
+                return result
+        return results[0]
+
+    def _delete_venv(self):
+        """Delete the virtual environment."""
+        try:
+            self.signals.progress.emit("Deleting virtual environment...")
+
+            if self.venv_path.exists():
+                rmtree_fast(self.venv_path)
+                self.logger.success("Virtual environment deleted")
+                self.signals.operation_finished.emit(True, "Virtual environment deleted")
+            else:
+                self.signals.operation_finished.emit(False, "Virtual environment not found")
+
+        except Exception as e:
+            self.logger.error(f"Venv deletion error: {str(e)}")
+            self.signals.operation_finished.emit(False, str(e))
+
+
+# Former QThread-based name
+VenvWorker = VenvTask
+
+
+class QtVenvManager(QObject, VenvManager):
+    """VenvManager that runs create/install/delete as thread-pool tasks.
+
+    Create on the GUI thread: task bookkeeping happens in its slots, which
+    Qt queues there from the pool threads.
+    """
+
+    def __init__(self, base_path: Optional[Path] = None):
+        # PyQt passes the keyword on to VenvManager.__init__ cooperatively
+        super().__init__(base_path=base_path)
+        self.logger = get_logger()
+        self.current_worker: Optional[VenvTask] = None
+        self._pool = QThreadPool.globalInstance()
+        # Running tasks by their signals object, with the venv name whose
+        # cached info is stale once the task finishes (or None)
+        self._tasks: Dict[VenvTaskSignals, Tuple[VenvTask, Optional[str]]] = {}
+
+    def _connect(self, task: VenvTask,
+                 on_output: Optional[Callable[[str], None]] = None,
+                 on_finished: Optional[Callable[[bool, str], None]] = None,
+                 on_progress: Optional[Callable[[str], None]] = None):
+        """Connect the caller's callbacks to a task's signals."""
+        if on_output:
+            task.signals.output_line.connect(on_output)
+        if on_finished:
+            task.signals.operation_finished.connect(on_finished)
+        if on_progress:
+            task.signals.progress.connect(on_progress)
+
+    def create_venv(
+        self,
+        name: str,
+        on_output: Optional[Callable[[str], None]] = None,
+        on_finished: Optional[Callable[[bool, str], None]] = None,
+        on_progress: Optional[Callable[[str], None]] = None
+    ) -> VenvTask:
+        """Create a new virtual environment."""
+        venv_path = self.base_path / name
+        self.invalidate(name)
+
+        self.current_worker = VenvTask(
+            "create", venv_path, template_dir=self._template_dir, venv_lock=self._name_lock(name)
+        )
+        self._connect(self.current_worker, on_output, on_finished, on_progress)
+        return self._submit(self.current_worker, name)
+
+    def install_requirements(
+        self,
+        name: str,
+        requirements_path: Path,
+        on_output: Optional[Callable[[str], None]] = None,
+        on_finished: Optional[Callable[[bool, str], None]] = None,
+        on_progress: Optional[Callable[[str], None]] = None,
+        parallel_install: Optional[int] = None
+    ) -> VenvTask:
+        """Install requirements in a virtual environment.
+
+        ``parallel_install`` > 1 installs the listed packages in that many
+        concurrent pip processes before the final resolving pass; by
+        default the app config's ``parallel_install`` is used.
+        """
+        venv_path = self.base_path / name
+        if parallel_install is None:
+            parallel_install = get_config_manager().config.parallel_install
+
+        self.current_worker = VenvTask(
+            "install",
+            venv_path,
+            requirements_path,
+            parallel_install=parallel_install,
+            pip_cache=self.pip_cache,
+            wheelhouse=self.wheelhouse,
+            venv_lock=self._name_lock(name)
+        )
+        self._connect(self.current_worker, on_output, on_finished, on_progress)
+        return self._submit(self.current_worker)
+
+    def delete_venv(
+        self,
+        name: str,
+        on_finished: Optional[Callable[[bool, str], None]] = None
+    ) -> VenvTask:
+        """Delete a virtual environment."""
+        venv_path = self.base_path / name
+        self.invalidate(name)
+
+        self.current_worker = VenvTask("delete", venv_path, venv_lock=self._name_lock(name))
+        self._connect(self.current_worker, on_finished=on_finished)
+        return self._submit(self.current_worker, name)
+
+    def _submit(self, task: VenvTask, invalidate_name: Optional[str] = None) -> VenvTask:
+        """Run a task on the thread pool, tracking it until it finishes."""
+        self._tasks[task.signals] = (task, invalidate_name)
+        task.signals.operation_finished.connect(self._on_task_finished)
+        self._pool.start(task)
+        return task
+
+    def _on_task_finished(self, success: bool, message: str):
+        """Forget a finished task, dropping the cached info it made stale."""
+        entry = self._tasks.pop(self.sender(), None)
+        if entry is not None and entry[1] is not None:
+            self.invalidate(entry[1])
+
+    def cancel_all(self):
+        """Cancel all running venv operations."""
+        for task, _ in list(self._tasks.values()):
+            task.cancel()
@@ -12,10 +12,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
 
 from app import __app_name__, __version__
-from app.windows.main_window import MainWindow
 from app.core.logger import get_logger
 
 
@@ -29,6 +27,10 @@ def setup_high_dpi():
 
 def main():
     """Main application entry point."""
+    # GUI-only imports, kept out of module import time
+    from PyQt5.QtGui import QFont
+    from app.windows.main_window import MainWindow
+
     # Setup high DPI before creating QApplication
     setup_high_dpi()
 
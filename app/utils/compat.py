@@ -0,0 +1,6 @@
+"""Compatibility shims for the supported Python versions (3.8+)."""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10; older versions keep a __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,151 @@
+"""Fast filesystem helpers."""
+
+import ctypes
+import os
+import stat
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from app.utils.shell import NO_WINDOW_FLAGS
+
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_NORMAL = 0x80
+IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003  # directory junction
+DRIVE_REMOTE = 4
+
+# Linux filesystem types whose writes go over the network
+REMOTE_FS_TYPES = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', 'fuse.sshfs', '9p', 'afs', 'ceph',
+})
+
+# Trees with more files than this are unlinked from a thread pool
+PARALLEL_UNLINK_MIN_FILES = 256
+# Threads issuing unlink calls; each call releases the GIL
+UNLINK_WORKERS = 16
+
+
+def _remove(func: Callable[[str], None], path: str):
+    """Call ``func(path)``, clearing a read-only attribute and retrying once on Windows."""
+    try:
+        func(path)
+    except PermissionError:
+        if sys.platform != 'win32':
+            raise
+        ctypes.windll.kernel32.SetFileAttributesW(path, FILE_ATTRIBUTE_NORMAL)
+        func(path)
+
+
+def _is_link(st: os.stat_result) -> bool:
+    """Whether an lstat result is a symlink or, on Windows, a junction."""
+    return (stat.S_ISLNK(st.st_mode)
+            or getattr(st, 'st_reparse_tag', 0) == IO_REPARSE_TAG_MOUNT_POINT)
+
+
+def is_link(path: Path) -> bool:
+    """Whether path is a symlink or junction, which rmtree must not follow."""
+    try:
+        return _is_link(os.lstat(path))
+    except OSError:
+        return False
+
+
+def rmtree_fast(root: Path):
+    """Remove a directory tree.
+
+    Walks with os.scandir and an explicit stack, using dirent types instead
+    of per-entry stats. Large trees have their files unlinked from a thread
+    pool, since the work is syscall latency. On Windows a native
+    ``rmdir /S /Q`` is tried first.
+
+    Like shutil.rmtree, refuses a root that is a symlink or junction; links
+    inside the tree are removed themselves, never descended into.
+    """
+    root = os.fspath(root)
+    if is_link(root):
+        raise OSError(f"Cannot call rmtree_fast on a symbolic link: {root}")
+
+    if sys.platform == 'win32':
+        # A single native rmdir is much faster than walking from Python
+        subprocess.run(
+            ['cmd', '/c', 'rmdir', '/S', '/Q', root],
+            capture_output=True,
+            creationflags=NO_WINDOW_FLAGS
+        )
+        if not os.path.lexists(root):
+            return
+
+    # Every directory is listed after its parent, so removing them in
+    # reverse order empties children first
+    dirs = [root]
+    files = []
+    # Directory symlinks and junctions on Windows, which need rmdir
+    dir_links = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if sys.platform == 'win32':
+                    # Before 3.12 is_dir(follow_symlinks=False) is True for
+                    # junctions; the attributes come from the directory listing
+                    st = entry.stat(follow_symlinks=False)
+                    if _is_link(st):
+                        if st.st_file_attributes & FILE_ATTRIBUTE_DIRECTORY:
+                            dir_links.append(entry.path)
+                        else:
+                            files.append(entry.path)
+                        continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    dirs.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    if len(files) > PARALLEL_UNLINK_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as pool:
+            # Consume the results so the first failure is raised here
+            for _ in pool.map(partial(_remove, os.unlink), files):
+                pass
+    else:
+        for path in files:
+            _remove(os.unlink, path)
+
+    for path in dir_links:
+        _remove(os.rmdir, path)
+
+    for path in reversed(dirs):
+        _remove(os.rmdir, path)
+
+
+def is_remote_path(path: Path) -> bool:
+    """Whether path lives on a network filesystem (SMB, NFS, sshfs...).
+
+    Best effort: uses the drive type on Windows and /proc/mounts on Linux;
+    anywhere else, or if the check fails, the path counts as local.
+    """
+    path = os.path.abspath(os.fspath(path))
+
+    if sys.platform == 'win32':
+        drive = os.path.splitdrive(path)[0]
+        if drive.startswith('\\\\'):
+            return True
+        return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == DRIVE_REMOTE
+
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+
+    # The longest mount point containing path is the one it lives on
+    best, best_type = '', ''
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        if len(mount_point) > len(best) and (
+                path == mount_point
+                or path.startswith(os.path.join(mount_point, ''))):
+            best, best_type = mount_point, fs_type
+    return best_type in REMOTE_FS_TYPES
@@ -1,11 +1,13 @@
 """Path utilities for PyInstaller Advanced Builder."""
 
+import functools
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1)
 def get_app_root() -> Path:
     """Get the application root directory."""
     if getattr(sys, 'frozen', False):
@@ -13,37 +15,42 @@ def get_app_root() -> Path:
     return Path(__file__).parent.parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get the configuration directory."""
-    config_dir = Path.home() / ".pyinstaller_builder"
-    config_dir.mkdir(parents=True, exist_ok=True)
-    return config_dir
+    return ensure_dir(Path.home() / ".pyinstaller_builder")
 
 
+@functools.lru_cache(maxsize=1)
 def get_plugins_dir() -> Path:
     """Get the plugins directory."""
     return get_app_root() / "plugins"
 
 
+@functools.lru_cache(maxsize=1)
 def get_assets_dir() -> Path:
     """Get the assets directory."""
     return get_app_root() / "assets"
 
 
+@functools.lru_cache(maxsize=1)
 def get_icons_dir() -> Path:
     """Get the icons directory."""
     return get_assets_dir() / "icons"
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_output_dir() -> Path:
     """Get the default output directory for builds."""
-    output_dir = Path.home() / "PyInstallerBuilds"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    return output_dir
+    return ensure_dir(Path.home() / "PyInstallerBuilds")
 
 
 def ensure_dir(path: Path) -> Path:
-    """Ensure a directory exists, creating it if necessary."""
+    """Ensure a directory exists, creating it if necessary.
+
+    Not memoized: a folder removed while the app runs must be recreated,
+    and mkdir(exist_ok=True) is a single syscall.
+    """
     path.mkdir(parents=True, exist_ok=True)
     return path
 
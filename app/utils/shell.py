@@ -1,13 +1,24 @@
 """Shell utilities for subprocess execution."""
 
+import locale
+import os
+import signal
 import subprocess
 import sys
 from pathlib import Path
 from typing import Optional, List, Callable, Any
 from dataclasses import dataclass
 
+from app.utils.compat import DATACLASS_SLOTS
 
-@dataclass
+# Keep child processes from allocating a console window on Windows
+NO_WINDOW_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+# Maximum bytes taken from a streamed process pipe per read
+STREAM_CHUNK_SIZE = 65536
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ProcessResult:
     """Result of a subprocess execution."""
     return_code: int
@@ -25,18 +36,24 @@ def run_command(
     command: List[str],
     cwd: Optional[Path] = None,
     env: Optional[dict] = None,
-    timeout: Optional[int] = None
+    timeout: Optional[int] = None,
+    text: bool = True
 ) -> ProcessResult:
-    """Run a command and return the result."""
+    """Run a command and return the result.
+
+    With ``text=False`` the process's stdout/stderr are returned as raw bytes,
+    leaving decoding (of only what is needed) to the caller.
+    """
+    empty = "" if text else b""
     try:
         result = subprocess.run(
             command,
             cwd=cwd,
             env=env,
             capture_output=True,
-            text=True,
+            text=text,
             timeout=timeout,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            creationflags=NO_WINDOW_FLAGS
         )
         return ProcessResult(
             return_code=result.returncode,
@@ -47,14 +64,14 @@ def run_command(
     except subprocess.TimeoutExpired as e:
         return ProcessResult(
             return_code=-1,
-            stdout=e.stdout or "",
+            stdout=e.stdout or empty,
             stderr=f"Command timed out after {timeout} seconds",
             success=False
         )
     except Exception as e:
         return ProcessResult(
             return_code=-1,
-            stdout="",
+            stdout=empty,
             stderr=str(e),
             success=False
         )
@@ -64,9 +81,26 @@ def run_command_stream(
     command: List[str],
     output_callback: Callable[[str], Any],
     cwd: Optional[Path] = None,
-    env: Optional[dict] = None
+    env: Optional[dict] = None,
+    creationflags: Optional[int] = None,
+    process_callback: Optional[Callable[[subprocess.Popen], Any]] = None,
+    collapse_duplicates: bool = False,
+    new_session: bool = False
 ) -> ProcessResult:
-    """Run a command with streaming output."""
+    """Run a command with streaming output.
+
+    ``process_callback`` receives the Popen handle as soon as the process
+    starts, so callers can terminate it from another thread. With
+    ``new_session`` the process leads its own process group on POSIX, so
+    stop_process_tree can reach its children too.
+
+    Carriage-return redraws (progress bars) are reduced to their final frame
+    before reaching ``output_callback``; with ``collapse_duplicates``
+    consecutive identical lines are passed on only once. The returned stdout
+    is the unfiltered output.
+    """
+    if creationflags is None:
+        creationflags = NO_WINDOW_FLAGS
     try:
         process = subprocess.Popen(
             command,
@@ -74,22 +108,66 @@ def run_command_stream(
             env=env,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+            bufsize=-1,
+            creationflags=creationflags,
+            start_new_session=new_session and sys.platform != 'win32'
         )
+        if process_callback is not None:
+            process_callback(process)
+
+        # Read the pipe in binary blocks and split lines ourselves; read1()
+        # returns whatever is available, so output still streams live
+        encoding = locale.getpreferredencoding(False)
+        read_chunk = process.stdout.read1
+        output = bytearray()
+        # Start of the line still being read
+        pending = bytearray()
+        last_line = None
 
-        stdout_lines = []
-        for line in iter(process.stdout.readline, ''):
-            if line:
-                stdout_lines.append(line)
-                output_callback(line.rstrip())
+        def trim_redrawn(buf: bytearray):
+            # emit_lines keeps only the last \r frame, so drop earlier ones
+            # now; a trailing \r may still be the first half of \r\n
+            cr = buf.rfind(b"\r", 0, len(buf) - 1)
+            if cr >= 0:
+                del buf[:cr + 1]
+
+        def emit_lines(raw_lines: List[bytes]):
+            nonlocal last_line
+            for raw_line in raw_lines:
+                raw_line = raw_line.rstrip(b"\r")
+                if b"\r" in raw_line:
+                    # Only the last frame of a \r-redrawn line is worth showing
+                    raw_line = raw_line.rsplit(b"\r", 1)[1]
+                if collapse_duplicates:
+                    if raw_line == last_line:
+                        continue
+                    last_line = raw_line
+                output_callback(raw_line.decode(encoding, errors="replace").rstrip())
+
+        while True:
+            chunk = read_chunk(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            output += chunk
+            last_nl = chunk.rfind(b"\n")
+            if last_nl < 0:
+                pending += chunk
+                trim_redrawn(pending)
+                continue
+            # Only the new chunk is split; pending is joined to its first line
+            lines = chunk[:last_nl].split(b"\n")
+            lines[0] = bytes(pending) + lines[0]
+            pending = bytearray(chunk[last_nl + 1:])
+            trim_redrawn(pending)
+            emit_lines(lines)
+        if pending:
+            emit_lines([bytes(pending)])
 
         process.wait()
 
         return ProcessResult(
             return_code=process.returncode,
-            stdout=''.join(stdout_lines),
+            stdout=output.decode(encoding, errors="replace").replace("\r\n", "\n"),
             stderr="",
             success=process.returncode == 0
         )
@@ -102,6 +180,39 @@ def run_command_stream(
         )
 
 
+def stop_process_tree(process: subprocess.Popen, timeout: float):
+    """Stop a process and the children it started, which may hold its pipes.
+
+    On Windows the tree is force-killed with taskkill. On POSIX the process
+    must lead its own group (run_command_stream's ``new_session``): the
+    group gets SIGTERM, then SIGKILL once the leader exits or ``timeout``
+    seconds pass. Blocks for up to ``timeout``; call it off the GUI thread.
+    """
+    if sys.platform == 'win32':
+        # taskkill finds the children through the still running parent
+        if process.poll() is None:
+            subprocess.run(
+                ['taskkill', '/T', '/F', '/PID', str(process.pid)],
+                capture_output=True,
+                creationflags=NO_WINDOW_FLAGS
+            )
+        return
+
+    def signal_group(sig: int):
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    signal_group(signal.SIGTERM)
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        pass
+    # Children that ignored SIGTERM would keep the output pipe open
+    signal_group(signal.SIGKILL)
+
+
 def open_folder(path: Path) -> bool:
     """Open a folder in the system file explorer."""
     try:
@@ -2,24 +2,44 @@
 
 import os
 import re
-from pathlib import Path
+import stat
 from typing import Tuple, Optional
 
+# Characters not allowed in Windows file names
+_INVALID_CHARS = '<>:"/\\|?*'
+_INVALID_CHARS_RE = re.compile('[' + re.escape(_INVALID_CHARS) + ']')
+_SANITIZE_TABLE = str.maketrans(_INVALID_CHARS, '_' * len(_INVALID_CHARS))
+
+# Simple version pattern: major.minor.patch
+_VERSION_RE = re.compile(r'^\d+\.\d+\.\d+$')
+
+_PY_SUFFIX = '.py'
+_ICO_SUFFIX = '.ico'
+
+
+def _classify(path: str) -> Tuple[Optional[os.stat_result], bool]:
+    """Stat ``path`` once; return (stat result or None if missing, is regular file)."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None, False
+    return st, stat.S_ISREG(st.st_mode)
+
 
 def validate_python_script(path: str) -> Tuple[bool, str]:
     """Validate that a path points to a valid Python script."""
     if not path:
         return False, "No script path provided"
 
-    file_path = Path(path)
+    st, is_file = _classify(path)
 
-    if not file_path.exists():
+    if st is None:
         return False, f"File does not exist: {path}"
 
-    if not file_path.is_file():
+    if not is_file:
         return False, f"Path is not a file: {path}"
 
-    if file_path.suffix.lower() != '.py':
+    if os.path.splitext(path)[1].lower() != _PY_SUFFIX:
         return False, "File must have .py extension"
 
     return True, "Valid Python script"
@@ -30,12 +50,12 @@ def validate_requirements_file(path: str) -> Tuple[bool, str]:
     if not path:
         return True, "No requirements file (optional)"
 
-    file_path = Path(path)
+    st, is_file = _classify(path)
 
-    if not file_path.exists():
+    if st is None:
         return False, f"File does not exist: {path}"
 
-    if not file_path.is_file():
+    if not is_file:
         return False, f"Path is not a file: {path}"
 
     return True, "Valid requirements file"
@@ -46,15 +66,15 @@ def validate_icon_file(path: str) -> Tuple[bool, str]:
     if not path:
         return True, "No icon file (optional)"
 
-    file_path = Path(path)
+    st, is_file = _classify(path)
 
-    if not file_path.exists():
+    if st is None:
         return False, f"Icon file does not exist: {path}"
 
-    if not file_path.is_file():
+    if not is_file:
         return False, f"Path is not a file: {path}"
 
-    if file_path.suffix.lower() != '.ico':
+    if os.path.splitext(path)[1].lower() != _ICO_SUFFIX:
         return False, "Icon file must have .ico extension for Windows"
 
     return True, "Valid icon file"
@@ -65,11 +85,9 @@ def validate_output_directory(path: str) -> Tuple[bool, str]:
     if not path:
         return False, "No output directory provided"
 
-    dir_path = Path(path)
-
     # Check if path can be created
     try:
-        dir_path.mkdir(parents=True, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
         return True, "Valid output directory"
     except PermissionError:
         return False, f"Permission denied: {path}"
@@ -83,10 +101,9 @@ def validate_app_name(name: str) -> Tuple[bool, str]:
         return False, "Application name is required"
 
     # Check for invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        if char in name:
-            return False, f"Name contains invalid character: {char}"
+    match = _INVALID_CHARS_RE.search(name)
+    if match:
+        return False, f"Name contains invalid character: {match.group(0)}"
 
     if len(name) > 100:
         return False, "Name is too long (max 100 characters)"
@@ -99,9 +116,7 @@ def validate_version_string(version: str) -> Tuple[bool, str]:
     if not version:
         return True, "No version (optional)"
 
-    # Simple version pattern: major.minor.patch
-    pattern = r'^\d+\.\d+\.\d+$'
-    if not re.match(pattern, version):
+    if not _VERSION_RE.match(version):
         return False, "Version must be in format: X.Y.Z (e.g., 1.0.0)"
 
     return True, "Valid version string"
@@ -109,16 +124,8 @@ def validate_version_string(version: str) -> Tuple[bool, str]:
 
 def sanitize_filename(name: str) -> str:
     """Sanitize a string to be safe as a filename."""
-    # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
-
-    # Remove leading/trailing spaces and dots
-    name = name.strip(' .')
-
-    # Limit length
-    if len(name) > 100:
-        name = name[:100]
+    # Replace invalid characters, remove leading/trailing spaces and dots,
+    # and limit length
+    name = name.translate(_SANITIZE_TABLE).strip(' .')[:100]
 
     return name or "unnamed"
@@ -1,28 +1,113 @@
 """Dialog windows for PyInstaller Advanced Builder."""
 
-from pathlib import Path
 from typing import Optional, List
 
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
+    QDialog, QVBoxLayout, QHBoxLayout,
     QLineEdit, QPushButton, QLabel, QFileDialog,
-    QComboBox, QListWidget, QListWidgetItem, QCheckBox,
-    QGroupBox, QTextEdit, QDialogButtonBox, QMessageBox,
-    QTabWidget, QWidget, QSpinBox, QFrame
+    QListWidget, QDialogButtonBox, QMessageBox
 )
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtGui import QValidator
 
-from app.core.config_manager import BuildConfig, InstallerConfig
+from app.core.config_manager import InstallerConfig
+from app.windows.file_dialogs import FILE_DIALOG_OPTIONS
 
 
-class HiddenImportsDialog(QDialog):
+# Installer type as stored in InstallerConfig <-> as shown in the combo box
+_INSTALLER_DISPLAY = {"nsis": "NSIS", "inno": "Inno Setup"}
+_INSTALLER_KEY = {v: k for k, v in _INSTALLER_DISPLAY.items()}
+
+
+def _refill_list(list_widget: QListWidget, items: List[str]):
+    """Replace a list's items with repaints and signals held off until done."""
+    list_widget.setUpdatesEnabled(False)
+    list_widget.blockSignals(True)
+    try:
+        list_widget.clear()
+        # One row-range insert into the now empty model
+        list_widget.insertItems(0, items)
+    finally:
+        list_widget.blockSignals(False)
+        list_widget.setUpdatesEnabled(True)
+
+
+def _make_file_dialog(parent) -> QFileDialog:
+    """Create a file picker meant to be kept and reused by ``parent``."""
+    file_dialog = QFileDialog(parent)
+    file_dialog.setFileMode(QFileDialog.ExistingFile)
+    # Same options as the main window's browse buttons
+    file_dialog.setOptions(FILE_DIALOG_OPTIONS)
+    return file_dialog
+
+
+def _pick_file(file_dialog: QFileDialog, title: str, name_filter: str) -> str:
+    """Run a reusable file picker; return the chosen path or ""."""
+    file_dialog.setWindowTitle(title)
+    file_dialog.setNameFilter(name_filter)
+    if file_dialog.exec_():
+        files = file_dialog.selectedFiles()
+        if files:
+            return files[0]
+    return ""
+
+
+class _UniqueValidator(QValidator):
+    """Accepts whitespace-free entries that are not already in ``existing``.
+
+    Empty and duplicate text is Intermediate, so it can still be typed
+    (e.g. as a prefix of a longer name) but is never submitted.
+    """
+
+    def __init__(self, existing: set, parent=None):
+        super().__init__(parent)
+        self.existing = existing
+
+    def validate(self, text: str, pos: int):
+        if any(ch.isspace() for ch in text):
+            return QValidator.Invalid, text, pos
+        if not text or text in self.existing:
+            return QValidator.Intermediate, text, pos
+        return QValidator.Acceptable, text, pos
+
+
+class _ReusableDialog:
+    """Mixin that keeps one dialog instance per parent window.
+
+    Building the widgets is the expensive part of opening a dialog, so
+    ``open_for`` constructs it once and afterwards only reloads its data.
+    """
+
+    # Attribute of the parent window holding the cached dialog
+    _INSTANCE_ATTR = ""
+
+    @classmethod
+    def open_for(cls, parent, *args):
+        """Return the parent's dialog, created on first use or reset with ``args``."""
+        if parent is None:
+            return cls(*args)
+        dialog = getattr(parent, cls._INSTANCE_ATTR, None)
+        if dialog is None:
+            dialog = cls(*args, parent=parent)
+            setattr(parent, cls._INSTANCE_ATTR, dialog)
+        else:
+            dialog._reset(*args)
+        return dialog
+
+    def _reset(self, *args):
+        """Reload the dialog's data before it is shown again."""
+
+
+class HiddenImportsDialog(QDialog, _ReusableDialog):
     """Dialog for managing hidden imports."""
 
+    _INSTANCE_ATTR = "_hidden_imports_dialog"
+
     def __init__(self, hidden_imports: List[str], parent=None):
         super().__init__(parent)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         self.hidden_imports = hidden_imports.copy()
+        self._imports_set = set(self.hidden_imports)
         self.setWindowTitle("Hidden Imports")
         self.setMinimumSize(400, 300)
         self._setup_ui()
@@ -40,20 +125,24 @@ class HiddenImportsDialog(QDialog):
 
         # List widget
         self.list_widget = QListWidget()
-        for item in self.hidden_imports:
-            self.list_widget.addItem(item)
+        self.list_widget.setUniformItemSizes(True)
+        _refill_list(self.list_widget, self.hidden_imports)
         layout.addWidget(self.list_widget)
 
         # Input row
         input_layout = QHBoxLayout()
         self.input_field = QLineEdit()
         self.input_field.setPlaceholderText("Enter module name...")
+        # Dedupe live; returnPressed only fires for acceptable input
+        self.input_field.setValidator(_UniqueValidator(self._imports_set, self))
         self.input_field.returnPressed.connect(self._add_import)
+        self.input_field.textChanged.connect(self._update_add_enabled)
         input_layout.addWidget(self.input_field)
 
-        add_btn = QPushButton("Add")
-        add_btn.clicked.connect(self._add_import)
-        input_layout.addWidget(add_btn)
+        self.add_btn = QPushButton("Add")
+        self.add_btn.setEnabled(False)
+        self.add_btn.clicked.connect(self._add_import)
+        input_layout.addWidget(self.add_btn)
 
         remove_btn = QPushButton("Remove")
         remove_btn.clicked.connect(self._remove_import)
@@ -69,30 +158,54 @@ class HiddenImportsDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def _update_add_enabled(self):
+        self.add_btn.setEnabled(self.input_field.hasAcceptableInput())
+
     def _add_import(self):
-        text = self.input_field.text().strip()
-        if text and text not in self.hidden_imports:
-            self.hidden_imports.append(text)
-            self.list_widget.addItem(text)
-            self.input_field.clear()
+        if not self.input_field.hasAcceptableInput():
+            return
+        text = self.input_field.text()
+        self._imports_set.add(text)
+        self.hidden_imports.append(text)
+        self.list_widget.addItem(text)
+        self.input_field.clear()
 
     def _remove_import(self):
         current = self.list_widget.currentItem()
         if current:
-            self.hidden_imports.remove(current.text())
-            self.list_widget.takeItem(self.list_widget.row(current))
+            row = self.list_widget.row(current)
+            self._imports_set.discard(current.text())
+            self.list_widget.takeItem(row)
+            del self.hidden_imports[row]
+            self._update_add_enabled()
+
+    def _reset(self, hidden_imports: List[str]):
+        self.hidden_imports = hidden_imports.copy()
+        # Updated in place: the input validator holds this set
+        self._imports_set.clear()
+        self._imports_set.update(self.hidden_imports)
+        _refill_list(self.list_widget, self.hidden_imports)
+        self.input_field.clear()
+        self._update_add_enabled()
 
     def get_imports(self) -> List[str]:
         return self.hidden_imports
 
 
-class DataFilesDialog(QDialog):
+class DataFilesDialog(QDialog, _ReusableDialog):
     """Dialog for managing data files to include."""
 
+    _INSTANCE_ATTR = "_data_files_dialog"
+
+    # Bulk reloads touching more rows than this replace the list widget
+    REBUILD_THRESHOLD = 200
+
     def __init__(self, data_files: List[str], parent=None):
         super().__init__(parent)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         self.data_files = data_files.copy()
+        self._files_set = set(self.data_files)
+        self._file_dialog = _make_file_dialog(self)
         self.setWindowTitle("Data Files")
         self.setMinimumSize(500, 350)
         self._setup_ui()
@@ -111,8 +224,8 @@ class DataFilesDialog(QDialog):
 
         # List widget
         self.list_widget = QListWidget()
-        for item in self.data_files:
-            self.list_widget.addItem(item)
+        self.list_widget.setUniformItemSizes(True)
+        _refill_list(self.list_widget, self.data_files)
         layout.addWidget(self.list_widget)
 
         # Input row
@@ -154,9 +267,7 @@ class DataFilesDialog(QDialog):
         layout.addWidget(buttons)
 
     def _browse_source(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select Data File", "", "All Files (*)"
-        )
+        path = _pick_file(self._file_dialog, "Select Data File", "All Files (*)")
         if path:
             self.source_field.setText(path)
 
@@ -166,7 +277,8 @@ class DataFilesDialog(QDialog):
 
         if source:
             entry = f"{source};{dest}"
-            if entry not in self.data_files:
+            if entry not in self._files_set:
+                self._files_set.add(entry)
                 self.data_files.append(entry)
                 self.list_widget.addItem(entry)
                 self.source_field.clear()
@@ -175,38 +287,63 @@ class DataFilesDialog(QDialog):
     def _remove_file(self):
         current = self.list_widget.currentItem()
         if current:
-            self.data_files.remove(current.text())
-            self.list_widget.takeItem(self.list_widget.row(current))
+            row = self.list_widget.row(current)
+            self._files_set.discard(current.text())
+            self.list_widget.takeItem(row)
+            del self.data_files[row]
+
+    def _reset(self, data_files: List[str]):
+        self.data_files = data_files.copy()
+        self._files_set = set(self.data_files)
+        if max(len(self.data_files), self.list_widget.count()) > self.REBUILD_THRESHOLD:
+            self._rebuild_list(self.data_files)
+        else:
+            _refill_list(self.list_widget, self.data_files)
+        self.source_field.clear()
+        self.dest_field.clear()
+
+    def _rebuild_list(self, items: List[str]):
+        """Swap in a freshly filled list widget; cheaper than editing many rows."""
+        old = self.list_widget
+        layout = self.layout()
+        index = layout.indexOf(old)
+        layout.removeWidget(old)
+        old.deleteLater()
+
+        self.list_widget = QListWidget()
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.insertItems(0, items)
+        layout.insertWidget(index, self.list_widget)
 
     def get_data_files(self) -> List[str]:
         return self.data_files
 
 
-class InstallerSettingsDialog(QDialog):
+class InstallerSettingsDialog(QDialog, _ReusableDialog):
     """Dialog for installer configuration."""
 
+    _INSTANCE_ATTR = "_installer_settings_dialog"
+
     def __init__(self, config: InstallerConfig, parent=None):
         super().__init__(parent)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
-        self.config = InstallerConfig(
-            enabled=config.enabled,
-            company_name=config.company_name,
-            app_name=config.app_name,
-            version=config.version,
-            setup_icon=config.setup_icon,
-            license_file=config.license_file,
-            installer_type=config.installer_type
-        )
+        # Frozen, so the caller's instance can be shared without a copy
+        self.config = config
+        # Shared by the icon and license pickers
+        self._file_dialog = _make_file_dialog(self)
         self.setWindowTitle("Installer Settings")
         self.setMinimumSize(450, 400)
         self._setup_ui()
+        self._populate()
 
     def _setup_ui(self):
+        # Only this rarely opened dialog needs these widgets
+        from PyQt5.QtWidgets import QCheckBox, QComboBox, QFormLayout, QGroupBox
+
         layout = QVBoxLayout(self)
 
         # Enable checkbox
         self.enable_check = QCheckBox("Enable installer creation")
-        self.enable_check.setChecked(self.config.enabled)
         self.enable_check.stateChanged.connect(self._toggle_enabled)
         layout.addWidget(self.enable_check)
 
@@ -216,30 +353,27 @@ class InstallerSettingsDialog(QDialog):
 
         # Installer type
         self.type_combo = QComboBox()
-        self.type_combo.addItems(["NSIS", "Inno Setup"])
-        self.type_combo.setCurrentText(
-            "NSIS" if self.config.installer_type == "nsis" else "Inno Setup"
-        )
+        self.type_combo.addItems(list(_INSTALLER_DISPLAY.values()))
         form_layout.addRow("Installer Type:", self.type_combo)
 
         # Company name
-        self.company_edit = QLineEdit(self.config.company_name)
+        self.company_edit = QLineEdit()
         self.company_edit.setPlaceholderText("Your Company Name")
         form_layout.addRow("Company Name:", self.company_edit)
 
         # App name
-        self.app_name_edit = QLineEdit(self.config.app_name)
+        self.app_name_edit = QLineEdit()
         self.app_name_edit.setPlaceholderText("Application Name")
         form_layout.addRow("Application Name:", self.app_name_edit)
 
         # Version
-        self.version_edit = QLineEdit(self.config.version)
+        self.version_edit = QLineEdit()
         self.version_edit.setPlaceholderText("1.0.0")
         form_layout.addRow("Version:", self.version_edit)
 
         # Setup icon
         icon_layout = QHBoxLayout()
-        self.icon_edit = QLineEdit(self.config.setup_icon)
+        self.icon_edit = QLineEdit()
         self.icon_edit.setPlaceholderText("Path to setup icon (.ico)")
         icon_layout.addWidget(self.icon_edit)
         icon_btn = QPushButton("Browse")
@@ -249,7 +383,7 @@ class InstallerSettingsDialog(QDialog):
 
         # License file
         license_layout = QHBoxLayout()
-        self.license_edit = QLineEdit(self.config.license_file)
+        self.license_edit = QLineEdit()
         self.license_edit.setPlaceholderText("Path to license file (.txt, .rtf)")
         license_layout.addWidget(self.license_edit)
         license_btn = QPushButton("Browse")
@@ -258,14 +392,13 @@ class InstallerSettingsDialog(QDialog):
         form_layout.addRow("License File:", license_layout)
 
         layout.addWidget(self.settings_group)
-        self._toggle_enabled(self.config.enabled)
 
         # Note
         note_label = QLabel(
             "Note: NSIS or Inno Setup must be installed on your system\n"
             "for installer creation to work."
         )
-        note_label.setStyleSheet("color: gray; font-style: italic;")
+        note_label.setObjectName("installerNote")
         layout.addWidget(note_label)
 
         layout.addStretch()
@@ -278,19 +411,35 @@ class InstallerSettingsDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
 
+    def _populate(self):
+        """Show the values of ``self.config`` in the widgets."""
+        config = self.config
+        self.enable_check.setChecked(config.enabled)
+        self.type_combo.setCurrentText(
+            _INSTALLER_DISPLAY.get(config.installer_type, "Inno Setup")
+        )
+        self.company_edit.setText(config.company_name)
+        self.app_name_edit.setText(config.app_name)
+        self.version_edit.setText(config.version)
+        self.icon_edit.setText(config.setup_icon)
+        self.license_edit.setText(config.license_file)
+        self._toggle_enabled(config.enabled)
+
+    def _reset(self, config: InstallerConfig):
+        self.config = config
+        self._populate()
+
     def _toggle_enabled(self, state):
         self.settings_group.setEnabled(bool(state))
 
     def _browse_icon(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select Icon", "", "Icon Files (*.ico)"
-        )
+        path = _pick_file(self._file_dialog, "Select Icon", "Icon Files (*.ico)")
         if path:
             self.icon_edit.setText(path)
 
     def _browse_license(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select License File", "", "Text Files (*.txt *.rtf)"
+        path = _pick_file(
+            self._file_dialog, "Select License File", "Text Files (*.txt *.rtf)"
         )
         if path:
             self.license_edit.setText(path)
@@ -303,17 +452,20 @@ class InstallerSettingsDialog(QDialog):
             version=self.version_edit.text().strip(),
             setup_icon=self.icon_edit.text().strip(),
             license_file=self.license_edit.text().strip(),
-            installer_type="nsis" if self.type_combo.currentText() == "NSIS" else "inno"
+            installer_type=_INSTALLER_KEY.get(self.type_combo.currentText(), "inno")
         )
 
 
-class PresetsDialog(QDialog):
+class PresetsDialog(QDialog, _ReusableDialog):
     """Dialog for managing build presets."""
 
+    _INSTANCE_ATTR = "_presets_dialog"
+
     def __init__(self, config_manager, parent=None):
         super().__init__(parent)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
         self.config_manager = config_manager
+        self._presets_dir = config_manager.config_dir / "presets"
         self.selected_preset = None
         self.setWindowTitle("Build Presets")
         self.setMinimumSize(400, 300)
@@ -325,6 +477,7 @@ class PresetsDialog(QDialog):
 
         # Presets list
         self.presets_list = QListWidget()
+        self.presets_list.setUniformItemSizes(True)
         self.presets_list.itemDoubleClicked.connect(self._load_preset)
         layout.addWidget(self.presets_list)
 
@@ -348,10 +501,7 @@ class PresetsDialog(QDialog):
         layout.addLayout(btn_layout)
 
     def _load_presets(self):
-        self.presets_list.clear()
-        presets = self.config_manager.list_presets()
-        for preset in presets:
-            self.presets_list.addItem(preset)
+        _refill_list(self.presets_list, self.config_manager.list_presets())
 
     def _load_preset(self):
         current = self.presets_list.currentItem()
@@ -369,18 +519,41 @@ class PresetsDialog(QDialog):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                preset_file = self.config_manager.config_dir / "presets" / f"{preset_name}.json"
-                if preset_file.exists():
-                    preset_file.unlink()
-                self._load_presets()
+                (self._presets_dir / f"{preset_name}.json").unlink(missing_ok=True)
+                # Drop just this row rather than rescanning the directory
+                self.presets_list.takeItem(self.presets_list.row(current))
+
+    def _reset(self, config_manager):
+        self.config_manager = config_manager
+        self._presets_dir = config_manager.config_dir / "presets"
+        self.selected_preset = None
+        self._load_presets()
 
     def get_selected_preset(self) -> Optional[str]:
         return self.selected_preset
 
 
-class AboutDialog(QDialog):
+class AboutDialog(QDialog, _ReusableDialog):
     """About dialog showing application information."""
 
+    _INSTANCE_ATTR = "_about_dialog"
+
+    _CACHED_HTML = (
+        '<p style="font-size: 16pt; font-weight: bold; margin: 0;">'
+        'PyInstaller Advanced Builder</p>'
+        '<p style="color: #888888; font-size: 10pt; margin-top: 8px;">v1.0.0</p>'
+        '<p style="font-size: 11pt; margin-top: 14px;">'
+        'A modern, feature-rich GUI tool for building Python applications '
+        'into standalone executables using PyInstaller. Supports themes, '
+        'plugins, and advanced build configurations.</p>'
+        '<hr style="background-color: #444444; height: 1px; border: none;">'
+        '<p style="color: #888888; font-size: 10pt;">'
+        '© 2025 PythonToEXE  —  MIT License</p>'
+        '<p style="font-size: 10pt;">GitHub: '
+        '<a href="https://github.com/AIMasterRace/PythonToEXE" '
+        'style="color: #4da6ff;">github.com/AIMasterRace/PythonToEXE</a></p>'
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
@@ -393,60 +566,13 @@ class AboutDialog(QDialog):
         layout.setContentsMargins(18, 18, 18, 18)
         layout.setSpacing(8)
 
-        # Title
-        title = QLabel("PyInstaller Advanced Builder")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setAlignment(Qt.AlignLeft)
-        layout.addWidget(title)
-
-        # Version
-        version = QLabel("v1.0.0")
-        version.setStyleSheet("color: #888888; font-size: 10pt;")
-        version.setAlignment(Qt.AlignLeft)
-        layout.addWidget(version)
-
-        layout.addSpacing(6)
-
-        # Description
-        desc = QLabel(
-            "A modern, feature-rich GUI tool for building Python applications "
-            "into standalone executables using PyInstaller. Supports themes, "
-            "plugins, and advanced build configurations."
-        )
-        desc.setStyleSheet("font-size: 11pt;")
-        desc.setAlignment(Qt.AlignLeft)
-        desc.setWordWrap(True)
-        layout.addWidget(desc)
-
-        layout.addSpacing(10)
-
-        # Separator
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("background-color: #444444;")
-        separator.setFixedHeight(1)
-        layout.addWidget(separator)
-
-        layout.addSpacing(10)
-
-        # Footer - Copyright & License
-        copyright_label = QLabel("© 2025 PythonToEXE  —  MIT License")
-        copyright_label.setStyleSheet("color: #888888; font-size: 10pt;")
-        copyright_label.setAlignment(Qt.AlignLeft)
-        layout.addWidget(copyright_label)
-
-        # GitHub link
-        github_label = QLabel(
-            'GitHub: <a href="https://github.com/AIMasterRace/PythonToEXE" '
-            'style="color: #4da6ff;">github.com/AIMasterRace/PythonToEXE</a>'
-        )
-        github_label.setStyleSheet("font-size: 10pt;")
-        github_label.setAlignment(Qt.AlignLeft)
-        github_label.setOpenExternalLinks(True)
-        layout.addWidget(github_label)
+        # All static content in one rich-text label
+        body = QLabel(self._CACHED_HTML)
+        body.setTextFormat(Qt.RichText)
+        body.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        body.setWordWrap(True)
+        body.setOpenExternalLinks(True)
+        layout.addWidget(body)
 
         layout.addStretch()
 
@@ -457,23 +583,7 @@ class AboutDialog(QDialog):
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         close_btn.setFixedSize(90, 28)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                color: #aaaaaa;
-                font-size: 10pt;
-            }
-            QPushButton:hover {
-                background-color: #3a3a3a;
-                border-color: #666666;
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-        """)
+        close_btn.setObjectName("aboutClose")
         btn_layout.addWidget(close_btn)
 
         layout.addLayout(btn_layout)
@@ -0,0 +1,8 @@
+"""QFileDialog settings shared between the main window and dialogs."""
+
+from PyQt5.QtWidgets import QFileDialog
+
+
+# Browse dialogs skip per-directory icon lookups and symlink resolution,
+# both of which stat every entry and stall on slow or network folders
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
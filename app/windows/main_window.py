@@ -1,18 +1,26 @@
 """Main application window for PyInstaller Advanced Builder."""
 
+import dataclasses
+import functools
+import logging
 import sys
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
-    QLineEdit, QPushButton, QLabel, QFileDialog, QTextEdit,
+    QLineEdit, QPushButton, QLabel, QFileDialog, QTextEdit, QPlainTextEdit,
     QComboBox, QCheckBox, QGroupBox, QTabWidget, QStatusBar,
     QMenuBar, QMenu, QAction, QToolBar, QSplitter, QFrame,
-    QMessageBox, QInputDialog, QProgressBar, QDialog
+    QMessageBox, QInputDialog, QProgressBar, QDialog, QButtonGroup
 )
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QFont, QTextCursor, QColor, QIcon
+from PyQt5.QtCore import (
+    Qt, QSize, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from PyQt5.QtGui import QFont, QColor, QIcon, QTextCharFormat, QTextCursor
 
 from app import __version__, __app_name__
 from app.core.builder import Builder, BuildResult, BuildStatus
@@ -20,27 +28,253 @@ from app.core.config_manager import (
     get_config_manager, ConfigManager, BuildConfig, InstallerConfig
 )
 from app.core.logger import get_logger, get_emitter, LogLevel
-from app.core.plugin_loader import get_plugin_loader
-from app.utils.validators import (
-    validate_python_script, validate_requirements_file,
-    validate_icon_file, validate_output_directory
-)
+from app.core.plugin_loader import PluginLoader, get_plugin_loader
 from app.utils.paths import get_default_output_dir
 from app.utils.shell import open_folder
-from app.windows.dialogs import (
-    HiddenImportsDialog, DataFilesDialog, InstallerSettingsDialog,
-    PresetsDialog, AboutDialog
-)
-
-
-class LogConsole(QTextEdit):
-    """Custom text edit for displaying build logs with color coding."""
-
-    def __init__(self, parent=None):
+from app.windows.file_dialogs import FILE_DIALOG_OPTIONS
+from app.windows.styles import DIALOG_STYLESHEET
+
+
+# Window stylesheets, including the rules shared with dialogs
+_DARK_QSS = """
+QMainWindow, QWidget {
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+QGroupBox {
+    border: 1px solid #3c3c3c;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox {
+    background-color: #2d2d2d;
+    border: 1px solid #3c3c3c;
+    border-radius: 4px;
+    padding: 5px;
+    color: #ffffff;
+}
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
+    border: 1px solid #0078d4;
+}
+QPushButton {
+    background-color: #0078d4;
+    border: none;
+    border-radius: 4px;
+    padding: 8px 16px;
+    color: white;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #1084d8;
+}
+QPushButton:pressed {
+    background-color: #006cbd;
+}
+QPushButton:disabled {
+    background-color: #4a4a4a;
+    color: #888888;
+}
+QTabWidget::pane {
+    border: 1px solid #3c3c3c;
+    border-radius: 4px;
+}
+QTabBar::tab {
+    background-color: #2d2d2d;
+    border: 1px solid #3c3c3c;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+QTabBar::tab:selected {
+    background-color: #0078d4;
+}
+QCheckBox {
+    spacing: 8px;
+}
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+}
+QStatusBar {
+    background-color: #007acc;
+    color: white;
+}
+QMenuBar {
+    background-color: #2d2d2d;
+}
+QMenuBar::item:selected {
+    background-color: #0078d4;
+}
+QMenu {
+    background-color: #2d2d2d;
+    border: 1px solid #3c3c3c;
+}
+QMenu::item:selected {
+    background-color: #0078d4;
+}
+QToolBar {
+    background-color: #2d2d2d;
+    border: none;
+    spacing: 5px;
+    padding: 5px;
+}
+QScrollBar:vertical {
+    background-color: #2d2d2d;
+    width: 12px;
+}
+QScrollBar::handle:vertical {
+    background-color: #5c5c5c;
+    border-radius: 6px;
+    min-height: 20px;
+}
+QScrollBar::handle:vertical:hover {
+    background-color: #6c6c6c;
+}
+""" + DIALOG_STYLESHEET
+
+_LIGHT_QSS = """
+QMainWindow, QWidget {
+    background-color: #f5f5f5;
+    color: #000000;
+}
+QGroupBox {
+    border: 1px solid #cccccc;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px;
+}
+QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox {
+    background-color: #ffffff;
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+    padding: 5px;
+    color: #000000;
+}
+QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {
+    border: 1px solid #0078d4;
+}
+QPushButton {
+    background-color: #0078d4;
+    border: none;
+    border-radius: 4px;
+    padding: 8px 16px;
+    color: white;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #1084d8;
+}
+QPushButton:pressed {
+    background-color: #006cbd;
+}
+QPushButton:disabled {
+    background-color: #cccccc;
+    color: #888888;
+}
+QTabWidget::pane {
+    border: 1px solid #cccccc;
+    border-radius: 4px;
+}
+QTabBar::tab {
+    background-color: #e0e0e0;
+    border: 1px solid #cccccc;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+QTabBar::tab:selected {
+    background-color: #0078d4;
+    color: white;
+}
+QCheckBox {
+    spacing: 8px;
+}
+QStatusBar {
+    background-color: #0078d4;
+    color: white;
+}
+QMenuBar {
+    background-color: #e0e0e0;
+}
+QMenuBar::item:selected {
+    background-color: #0078d4;
+    color: white;
+}
+QMenu {
+    background-color: #ffffff;
+    border: 1px solid #cccccc;
+}
+QMenu::item:selected {
+    background-color: #0078d4;
+    color: white;
+}
+QToolBar {
+    background-color: #e0e0e0;
+    border: none;
+    spacing: 5px;
+    padding: 5px;
+}
+QTextEdit, QPlainTextEdit {
+    background-color: #1e1e1e;
+    color: #ffffff;
+}
+""" + DIALOG_STYLESHEET
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_csv(text: str) -> Tuple[str, ...]:
+    """Split comma-separated text into its non-empty, stripped items."""
+    return tuple(item for item in map(str.strip, text.split(",")) if item)
+
+
+def _output_level(line: str, _lower=str.lower) -> str:
+    """Classify a line of build output by the keywords it contains."""
+    # str.lower is bound as a default so the lookup happens once, not per line
+    lower_line = _lower(line)
+    if "error" in lower_line or "failed" in lower_line:
+        return "ERROR"
+    if "warning" in lower_line:
+        return "WARNING"
+    if "success" in lower_line or "completed" in lower_line:
+        return "SUCCESS"
+    return "INFO"
+
+
+class LogConsole(QPlainTextEdit):
+    """Plain text console for displaying build logs with color coding."""
+
+    # Milliseconds between flushes of queued lines into the document
+    FLUSH_INTERVAL_MS = 50
+    # Lines kept for the console while it is hidden
+    HIDDEN_BUFFER_LINES = 5000
+    # Severity of each log level; SUCCESS ranks with INFO
+    LEVEL_RANKS = {
+        "DEBUG": logging.DEBUG,
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "SUCCESS": logging.INFO,
+    }
+
+    def __init__(self, parent=None, max_blocks: int = 2000):
         super().__init__(parent)
         self.setReadOnly(True)
         self.setFont(QFont("Consolas", 9))
-        self.setLineWrapMode(QTextEdit.NoWrap)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # Old lines are dropped by the document itself once the limit is hit
+        self.setMaximumBlockCount(max_blocks or 2000)
+        self.setCenterOnScroll(False)
 
         # Color mapping for log levels
         self.colors = {
@@ -50,40 +284,200 @@ class LogConsole(QTextEdit):
             "ERROR": QColor("#FF4444"),
             "SUCCESS": QColor("#44FF44")
         }
+        # One char format per level, shared by every insert of that level
+        self._formats: Dict[str, QTextCharFormat] = {}
+        for level, color in self.colors.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(color)
+            self._formats[level] = fmt
+        self._info_format = self._formats["INFO"]
+
+        # Lines are queued as (text, level) and written in batches, so a
+        # burst of output costs one document edit instead of one per line
+        self._pending: List[Tuple[str, str]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+        # While hidden, lines are only remembered and written on the next show
+        self._hidden_buffer: Deque[Tuple[str, str]] = deque(maxlen=self.HIDDEN_BUFFER_LINES)
+
+        # Log messages below this rank are dropped before they are queued
+        self._min_rank = logging.DEBUG
+
+    def set_min_level(self, level: str):
+        """Only show log messages at or above the given level."""
+        self._min_rank = self.LEVEL_RANKS.get(level.upper(), logging.DEBUG)
+
+    def _queue(self, entries: List[Tuple[str, str]]):
+        """Queue (text, level) lines for the next flush."""
+        if not self.isVisible():
+            self._hidden_buffer.extend(entries)
+            return
+        self._pending.extend(entries)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Write queued lines, one insert per run of same-level lines."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+
+        bar = self.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+
+        document = self.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        get_format = self._formats.get
+        info_format = self._info_format
+        for level, group in groupby(pending, key=itemgetter(1)):
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(
+                "\n".join(text for text, _ in group),
+                get_format(level, info_format)
+            )
+        cursor.endEditBlock()
+
+        # Follow new output unless the user scrolled up to read
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+    def showEvent(self, event):
+        """Write lines that arrived while the console was hidden."""
+        super().showEvent(event)
+        if self._hidden_buffer:
+            self._pending.extend(self._hidden_buffer)
+            self._hidden_buffer.clear()
+            self._flush()
+
+    def clear(self):
+        """Clear the console, dropping any lines not yet written."""
+        self._pending.clear()
+        self._hidden_buffer.clear()
+        super().clear()
 
     def append_log(self, message: str, level: str = "INFO"):
         """Append a log message with appropriate coloring."""
-        color = self.colors.get(level, self.colors["INFO"])
-        self.setTextColor(color)
-        self.append(message)
-        self.moveCursor(QTextCursor.End)
-
-    def append_output(self, line: str):
-        """Append raw build output."""
-        # Detect errors in output
-        lower_line = line.lower()
-        if "error" in lower_line or "failed" in lower_line:
-            self.setTextColor(self.colors["ERROR"])
-        elif "warning" in lower_line:
-            self.setTextColor(self.colors["WARNING"])
-        elif "success" in lower_line or "completed" in lower_line:
-            self.setTextColor(self.colors["SUCCESS"])
-        else:
-            self.setTextColor(self.colors["INFO"])
+        if self.LEVEL_RANKS.get(level, logging.INFO) < self._min_rank:
+            return
+        self._queue([(message, level)])
+
+    def append_output(self, text: str):
+        """Append raw build output, one or more newline-separated lines."""
+        self._queue([(line, _output_level(line)) for line in text.split("\n")])
 
-        self.append(line)
-        self.moveCursor(QTextCursor.End)
+
+class _CallSignals(QObject):
+    """Signals of a _CallTask; QRunnable itself is not a QObject."""
+
+    done = pyqtSignal(object)  # return value of func
+    failed = pyqtSignal(str)  # message of the exception func raised
+
+
+class _CallTask(QRunnable):
+    """Runs a function on a pool thread and emits its result."""
+
+    def __init__(self, func: Callable[[], Any]):
+        super().__init__()
+        self._func = func
+        # Created on the GUI thread, so connected slots run there too
+        self.signals = _CallSignals()
+        # The window keeps a reference for as long as it needs the result
+        self.setAutoDelete(False)
+
+    def run(self):
+        # Exactly one signal is always emitted, so callers never wait forever
+        try:
+            result = self._func()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.done.emit(result)
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    # Menu bar layout: (title, items), where each item is
+    # (text, shortcut, slot name, attribute to store the action in) or
+    # None for a separator
+    _MENU_SPEC = (
+        ("&File", (
+            ("&New Project", "Ctrl+N", "_new_project", None),
+            ("&Open Script...", "Ctrl+O", "_browse_script", None),
+            None,
+            ("&Save Preset...", "Ctrl+S", "_save_preset", None),
+            ("&Load Preset...", "Ctrl+L", "_load_preset", None),
+            None,
+            ("E&xit", "Alt+F4", "close", None),
+        )),
+        ("&Build", (
+            ("&Build", "F5", "_start_build", None),
+            ("&Cancel Build", "Ctrl+Break", "_cancel_build", None),
+            None,
+            ("&Open Output Folder", None, "_open_output_folder", None),
+        )),
+        ("&View", (
+            ("&Toggle Theme", "Ctrl+T", "_toggle_theme", "theme_action"),
+            ("&Clear Logs", "Ctrl+Shift+C", "_clear_logs", None),
+        )),
+        ("&Tools", (
+            ("&Hidden Imports...", None, "_show_hidden_imports", None),
+            ("&Data Files...", None, "_show_data_files", None),
+            None,
+            ("&Installer Settings...", None, "_show_installer_settings", None),
+            None,
+            ("&Reload Plugins", None, "_reload_plugins", None),
+        )),
+        ("&Help", (
+            ("&About", None, "_show_about", None),
+        )),
+    )
+
+    # Build input checks as (validator name in app.utils.validators, line
+    # edit attribute), run in order until one fails. Each is a single
+    # stat; the output directory goes last since validating it creates it
+    _VALIDATION_SPEC = (
+        ("validate_python_script", "script_edit"),
+        ("validate_requirements_file", "req_edit"),
+        ("validate_icon_file", "icon_edit"),
+        ("validate_output_directory", "output_edit"),
+    )
+
+    # Indexes of the settings tabs that are built on first visit
+    ADVANCED_TAB = 1
+    INSTALLER_TAB = 2
+    PLUGINS_TAB = 3
+
+    # Config changes within this window are written in a single save
+    CONFIG_SAVE_DELAY_MS = 250
+
     def __init__(self):
         super().__init__()
         self.config_manager = get_config_manager()
         self.logger = get_logger()
         self.builder = Builder()
-        self.plugin_loader = get_plugin_loader()
+
+        self._config_save_timer = QTimer(self)
+        self._config_save_timer.setSingleShot(True)
+        self._config_save_timer.setInterval(self.CONFIG_SAVE_DELAY_MS)
+        self._config_save_timer.timeout.connect(self.config_manager.save_if_dirty)
+
+        # Plugins are imported on a pool thread once the window is shown
+        self.plugin_loader: Optional[PluginLoader] = None
+        self._plugin_task: Optional[_CallTask] = None
+        # Interpreter scans run off the GUI thread, one at a time
+        self._venv_manager = None
+        self._interp_task: Optional[_CallTask] = None
+        self._interp_scanning = False
+
+        # Last _get_build_config result and the UI state it was built from
+        self._build_config_cache: Optional[Tuple[tuple, BuildConfig]] = None
 
         self._is_dark_theme = self.config_manager.config.theme == "dark"
 
@@ -93,8 +487,11 @@ class MainWindow(QMainWindow):
         self._setup_ui()
         self._setup_statusbar()
         self._connect_signals()
-        self._apply_theme()
-        self._load_config()
+
+        # Styling and field population run once the event loop starts, so
+        # the window is shown without waiting for a full stylesheet polish
+        QTimer.singleShot(0, self._apply_theme)
+        QTimer.singleShot(0, self._load_config)
 
     def _setup_window(self):
         """Configure main window properties."""
@@ -106,99 +503,20 @@ class MainWindow(QMainWindow):
         """Setup menu bar."""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("&File")
-
-        new_action = QAction("&New Project", self)
-        new_action.setShortcut("Ctrl+N")
-        new_action.triggered.connect(self._new_project)
-        file_menu.addAction(new_action)
-
-        open_action = QAction("&Open Script...", self)
-        open_action.setShortcut("Ctrl+O")
-        open_action.triggered.connect(self._browse_script)
-        file_menu.addAction(open_action)
-
-        file_menu.addSeparator()
-
-        save_preset_action = QAction("&Save Preset...", self)
-        save_preset_action.setShortcut("Ctrl+S")
-        save_preset_action.triggered.connect(self._save_preset)
-        file_menu.addAction(save_preset_action)
-
-        load_preset_action = QAction("&Load Preset...", self)
-        load_preset_action.setShortcut("Ctrl+L")
-        load_preset_action.triggered.connect(self._load_preset)
-        file_menu.addAction(load_preset_action)
-
-        file_menu.addSeparator()
-
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut("Alt+F4")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Build menu
-        build_menu = menubar.addMenu("&Build")
-
-        build_action = QAction("&Build", self)
-        build_action.setShortcut("F5")
-        build_action.triggered.connect(self._start_build)
-        build_menu.addAction(build_action)
-
-        cancel_action = QAction("&Cancel Build", self)
-        cancel_action.setShortcut("Ctrl+Break")
-        cancel_action.triggered.connect(self._cancel_build)
-        build_menu.addAction(cancel_action)
-
-        build_menu.addSeparator()
-
-        open_output_action = QAction("&Open Output Folder", self)
-        open_output_action.triggered.connect(self._open_output_folder)
-        build_menu.addAction(open_output_action)
-
-        # View menu
-        view_menu = menubar.addMenu("&View")
-
-        self.theme_action = QAction("&Toggle Theme", self)
-        self.theme_action.setShortcut("Ctrl+T")
-        self.theme_action.triggered.connect(self._toggle_theme)
-        view_menu.addAction(self.theme_action)
-
-        clear_logs_action = QAction("&Clear Logs", self)
-        clear_logs_action.setShortcut("Ctrl+Shift+C")
-        clear_logs_action.triggered.connect(self._clear_logs)
-        view_menu.addAction(clear_logs_action)
-
-        # Tools menu
-        tools_menu = menubar.addMenu("&Tools")
-
-        hidden_imports_action = QAction("&Hidden Imports...", self)
-        hidden_imports_action.triggered.connect(self._show_hidden_imports)
-        tools_menu.addAction(hidden_imports_action)
-
-        data_files_action = QAction("&Data Files...", self)
-        data_files_action.triggered.connect(self._show_data_files)
-        tools_menu.addAction(data_files_action)
-
-        tools_menu.addSeparator()
-
-        installer_action = QAction("&Installer Settings...", self)
-        installer_action.triggered.connect(self._show_installer_settings)
-        tools_menu.addAction(installer_action)
-
-        tools_menu.addSeparator()
-
-        plugins_action = QAction("&Reload Plugins", self)
-        plugins_action.triggered.connect(self._reload_plugins)
-        tools_menu.addAction(plugins_action)
-
-        # Help menu
-        help_menu = menubar.addMenu("&Help")
-
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        for menu_title, items in self._MENU_SPEC:
+            menu = menubar.addMenu(menu_title)
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, slot, attr = item
+                action = QAction(text, self)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, slot))
+                menu.addAction(action)
+                if attr:
+                    setattr(self, attr, action)
 
     def _setup_toolbar(self):
         """Setup toolbar."""
@@ -248,24 +566,23 @@ class MainWindow(QMainWindow):
         settings_layout.setContentsMargins(0, 0, 0, 0)
 
         # Tab widget for different settings
-        tab_widget = QTabWidget()
-        settings_layout.addWidget(tab_widget)
+        self.tab_widget = QTabWidget()
+        settings_layout.addWidget(self.tab_widget)
 
         # Basic Settings Tab
         basic_tab = self._create_basic_tab()
-        tab_widget.addTab(basic_tab, "Basic Settings")
-
-        # Advanced Settings Tab
-        advanced_tab = self._create_advanced_tab()
-        tab_widget.addTab(advanced_tab, "Advanced")
-
-        # Installer Tab (Placeholder)
-        installer_tab = self._create_installer_tab()
-        tab_widget.addTab(installer_tab, "Installer")
-
-        # Plugins Tab
-        plugins_tab = self._create_plugins_tab()
-        tab_widget.addTab(plugins_tab, "Plugins")
+        self.tab_widget.addTab(basic_tab, "Basic Settings")
+
+        # The other tabs start as empty pages and are built on first visit
+        self.tab_widget.addTab(QWidget(), "Advanced")
+        self.tab_widget.addTab(QWidget(), "Installer")
+        self.tab_widget.addTab(QWidget(), "Plugins")
+        self._tab_builders = {
+            self.ADVANCED_TAB: self._create_advanced_tab,
+            self.INSTALLER_TAB: self._create_installer_tab,
+            self.PLUGINS_TAB: self._create_plugins_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._realize_tab)
 
         splitter.addWidget(settings_widget)
 
@@ -286,7 +603,11 @@ class MainWindow(QMainWindow):
 
         log_layout.addLayout(log_header)
 
-        self.log_console = LogConsole()
+        self.log_console = LogConsole(
+            max_blocks=self.config_manager.config.max_log_blocks
+        )
+        self.log_console.set_min_level(self.config_manager.config.log_level)
+        self.logger.set_level(self.config_manager.config.log_level)
         log_layout.addWidget(self.log_console)
 
         splitter.addWidget(log_widget)
@@ -294,6 +615,33 @@ class MainWindow(QMainWindow):
         # Set splitter sizes (55% settings, 45% logs)
         splitter.setSizes([550, 450])
 
+    def _tab_ready(self, index: int) -> bool:
+        """Return True once the tab at index has been built."""
+        return index not in self._tab_builders
+
+    def _realize_tab(self, index: int):
+        """Build a deferred tab the first time it is selected."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+
+        page = builder()
+        title = self.tab_widget.tabText(index)
+        placeholder = self.tab_widget.widget(index)
+
+        # Swapping the page would otherwise re-enter this slot
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, page, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        if index == self.ADVANCED_TAB:
+            self._load_advanced_fields()
+        elif index == self.INSTALLER_TAB:
+            self._load_installer_fields()
+
     def _create_basic_tab(self) -> QWidget:
         """Create basic settings tab."""
         tab = QWidget()
@@ -367,12 +715,10 @@ class MainWindow(QMainWindow):
         options_layout.addWidget(self.onedir_check)
 
         # Make mutually exclusive
-        self.onefile_check.stateChanged.connect(
-            lambda s: self.onedir_check.setChecked(not s) if s else None
-        )
-        self.onedir_check.stateChanged.connect(
-            lambda s: self.onefile_check.setChecked(not s) if s else None
-        )
+        self.mode_group = QButtonGroup(self)
+        self.mode_group.setExclusive(True)
+        self.mode_group.addButton(self.onefile_check)
+        self.mode_group.addButton(self.onedir_check)
 
         options_layout.addSpacing(30)
 
@@ -556,232 +902,53 @@ class MainWindow(QMainWindow):
 
     def _apply_theme(self):
         """Apply current theme to the application."""
-        if self._is_dark_theme:
-            self._apply_dark_theme()
-        else:
-            self._apply_light_theme()
-
-    def _apply_dark_theme(self):
-        """Apply dark theme stylesheet."""
-        stylesheet = """
-            QMainWindow, QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-            QGroupBox {
-                border: 1px solid #3c3c3c;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QTextEdit, QComboBox, QSpinBox {
-                background-color: #2d2d2d;
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-                padding: 5px;
-                color: #ffffff;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 1px solid #0078d4;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1084d8;
-            }
-            QPushButton:pressed {
-                background-color: #006cbd;
-            }
-            QPushButton:disabled {
-                background-color: #4a4a4a;
-                color: #888888;
-            }
-            QTabWidget::pane {
-                border: 1px solid #3c3c3c;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background-color: #2d2d2d;
-                border: 1px solid #3c3c3c;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-            }
-            QCheckBox {
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QStatusBar {
-                background-color: #007acc;
-                color: white;
-            }
-            QMenuBar {
-                background-color: #2d2d2d;
-            }
-            QMenuBar::item:selected {
-                background-color: #0078d4;
-            }
-            QMenu {
-                background-color: #2d2d2d;
-                border: 1px solid #3c3c3c;
-            }
-            QMenu::item:selected {
-                background-color: #0078d4;
-            }
-            QToolBar {
-                background-color: #2d2d2d;
-                border: none;
-                spacing: 5px;
-                padding: 5px;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 12px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #5c5c5c;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #6c6c6c;
-            }
-        """
-        self.setStyleSheet(stylesheet)
-
-    def _apply_light_theme(self):
-        """Apply light theme stylesheet."""
-        stylesheet = """
-            QMainWindow, QWidget {
-                background-color: #f5f5f5;
-                color: #000000;
-            }
-            QGroupBox {
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-            }
-            QLineEdit, QTextEdit, QComboBox, QSpinBox {
-                background-color: #ffffff;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 5px;
-                color: #000000;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 1px solid #0078d4;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                color: white;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1084d8;
-            }
-            QPushButton:pressed {
-                background-color: #006cbd;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #888888;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                border: 1px solid #cccccc;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QCheckBox {
-                spacing: 8px;
-            }
-            QStatusBar {
-                background-color: #0078d4;
-                color: white;
-            }
-            QMenuBar {
-                background-color: #e0e0e0;
-            }
-            QMenuBar::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QMenu {
-                background-color: #ffffff;
-                border: 1px solid #cccccc;
-            }
-            QMenu::item:selected {
-                background-color: #0078d4;
-                color: white;
-            }
-            QToolBar {
-                background-color: #e0e0e0;
-                border: none;
-                spacing: 5px;
-                padding: 5px;
-            }
-            QTextEdit {
-                background-color: #1e1e1e;
-                color: #ffffff;
-            }
-        """
-        self.setStyleSheet(stylesheet)
+        self.setStyleSheet(_DARK_QSS if self._is_dark_theme else _LIGHT_QSS)
 
     def _toggle_theme(self):
         """Toggle between dark and light themes."""
         self._is_dark_theme = not self._is_dark_theme
         self._apply_theme()
-        self.config_manager.set("theme", "dark" if self._is_dark_theme else "light")
+        self._set_config("theme", "dark" if self._is_dark_theme else "light")
         self.logger.info(f"Theme changed to {'dark' if self._is_dark_theme else 'light'}")
 
     def _load_config(self):
         """Load configuration into UI."""
         config = self.config_manager.config.build_config
+        fields = (
+            self.script_edit, self.req_edit, self.output_edit,
+            self.app_name_edit, self.icon_edit, self.onefile_check,
+            self.onedir_check, self.console_check, self.clean_check,
+        )
 
-        self.script_edit.setText(config.script_path)
-        self.req_edit.setText(config.requirements_path)
-        self.output_edit.setText(config.output_dir or str(get_default_output_dir()))
-        self.app_name_edit.setText(config.app_name)
-        self.icon_edit.setText(config.icon_path)
-        self.onefile_check.setChecked(config.one_file)
-        self.onedir_check.setChecked(not config.one_file)
-        self.console_check.setChecked(config.console_mode)
-        self.clean_check.setChecked(config.clean_build)
+        # Repaint once and skip per-field change signals for the bulk load
+        central = self.centralWidget()
+        central.setUpdatesEnabled(False)
+        for widget in fields:
+            widget.blockSignals(True)
+        try:
+            self.script_edit.setText(config.script_path)
+            self.req_edit.setText(config.requirements_path)
+            self.output_edit.setText(config.output_dir or str(get_default_output_dir()))
+            self.app_name_edit.setText(config.app_name)
+            self.icon_edit.setText(config.icon_path)
+            self.onefile_check.setChecked(config.one_file)
+            self.onedir_check.setChecked(not config.one_file)
+            self.console_check.setChecked(config.console_mode)
+            self.clean_check.setChecked(config.clean_build)
+
+            # Fields on deferred tabs are filled when those tabs are built
+            if self._tab_ready(self.ADVANCED_TAB):
+                self._load_advanced_fields()
+            if self._tab_ready(self.INSTALLER_TAB):
+                self._load_installer_fields()
+        finally:
+            for widget in fields:
+                widget.blockSignals(False)
+            central.setUpdatesEnabled(True)
+
+    def _load_advanced_fields(self):
+        """Load configuration into the advanced tab."""
+        config = self.config_manager.config.build_config
         self.additional_args_edit.setText(config.additional_args)
 
         # Exclude modules (convert list to comma-separated string)
@@ -791,13 +958,28 @@ class MainWindow(QMainWindow):
         self._update_hidden_imports_label()
         self._update_data_files_label()
 
-        # Installer
+    def _load_installer_fields(self):
+        """Load configuration into the installer tab."""
         self.installer_enable_check.setChecked(
             self.config_manager.config.installer_config.enabled
         )
 
-    def _save_config(self):
-        """Save current UI state to configuration."""
+    def _schedule_config_save(self):
+        """Mark the config dirty and coalesce rapid changes into one save."""
+        self.config_manager.mark_dirty()
+        if not self._config_save_timer.isActive():
+            self._config_save_timer.start()
+
+    def _set_config(self, key: str, value: Any):
+        """Set an app config value and schedule a save."""
+        self.config_manager.set(key, value)
+        self._schedule_config_save()
+
+    def _save_config(self, immediate: bool = True):
+        """Save current UI state to configuration.
+
+        With immediate=False the write is left to the coalescing save timer.
+        """
         config = self.config_manager.config.build_config
         config.script_path = self.script_edit.text()
         config.requirements_path = self.req_edit.text()
@@ -807,54 +989,95 @@ class MainWindow(QMainWindow):
         config.one_file = self.onefile_check.isChecked()
         config.console_mode = self.console_check.isChecked()
         config.clean_build = self.clean_check.isChecked()
-        config.additional_args = self.additional_args_edit.text()
 
-        # Exclude modules (convert comma-separated string to list)
-        exclude_text = self.exclude_modules_edit.text()
-        config.exclude_modules = [m.strip() for m in exclude_text.split(",") if m.strip()]
+        # Tabs that were never built still hold the loaded values
+        if self._tab_ready(self.ADVANCED_TAB):
+            config.additional_args = self.additional_args_edit.text()
 
-        self.config_manager.config.installer_config.enabled = (
-            self.installer_enable_check.isChecked()
-        )
+            # Exclude modules (convert comma-separated string to list)
+            config.exclude_modules = list(_parse_csv(self.exclude_modules_edit.text()))
 
-        self.config_manager.save()
+        if self._tab_ready(self.INSTALLER_TAB):
+            self.config_manager.config.installer_config = dataclasses.replace(
+                self.config_manager.config.installer_config,
+                enabled=self.installer_enable_check.isChecked()
+            )
+
+        if immediate:
+            self.config_manager.save()
+        else:
+            self._schedule_config_save()
 
     def _get_build_config(self) -> BuildConfig:
-        """Get current build configuration from UI."""
-        # Parse exclude modules from comma-separated text
-        exclude_text = self.exclude_modules_edit.text()
-        exclude_modules = [m.strip() for m in exclude_text.split(",") if m.strip()]
-
-        return BuildConfig(
-            script_path=self.script_edit.text(),
-            requirements_path=self.req_edit.text(),
-            output_dir=self.output_edit.text(),
-            icon_path=self.icon_edit.text(),
-            app_name=self.app_name_edit.text(),
-            one_file=self.onefile_check.isChecked(),
-            console_mode=self.console_check.isChecked(),
-            clean_build=self.clean_check.isChecked(),
-            hidden_imports=self.config_manager.config.build_config.hidden_imports,
-            exclude_modules=exclude_modules,
-            data_files=self.config_manager.config.build_config.data_files,
-            additional_args=self.additional_args_edit.text()
+        """Get current build configuration from UI.
+
+        The last result is reused while the UI state it was built from is
+        unchanged; callers must treat it as read-only.
+        """
+        saved = self.config_manager.config.build_config
+        if self._tab_ready(self.ADVANCED_TAB):
+            # Parse exclude modules from comma-separated text
+            exclude_modules = _parse_csv(self.exclude_modules_edit.text())
+            additional_args = self.additional_args_edit.text()
+        else:
+            exclude_modules = tuple(saved.exclude_modules)
+            additional_args = saved.additional_args
+
+        key = (
+            self.script_edit.text(),
+            self.req_edit.text(),
+            self.output_edit.text(),
+            self.icon_edit.text(),
+            self.app_name_edit.text(),
+            self.onefile_check.isChecked(),
+            self.console_check.isChecked(),
+            self.clean_check.isChecked(),
+            tuple(saved.hidden_imports),
+            exclude_modules,
+            tuple(saved.data_files),
+            additional_args,
         )
+        cached = self._build_config_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        (script_path, requirements_path, output_dir, icon_path, app_name,
+         one_file, console_mode, clean_build, hidden_imports, exclude_modules,
+         data_files, additional_args) = key
+        config = BuildConfig(
+            script_path=script_path,
+            requirements_path=requirements_path,
+            output_dir=output_dir,
+            icon_path=icon_path,
+            app_name=app_name,
+            one_file=one_file,
+            console_mode=console_mode,
+            clean_build=clean_build,
+            hidden_imports=list(hidden_imports),
+            exclude_modules=list(exclude_modules),
+            data_files=list(data_files),
+            additional_args=additional_args
+        )
+        self._build_config_cache = (key, config)
+        return config
 
     # File browser methods
     def _browse_script(self):
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Python Script",
             self.config_manager.config.last_script_dir,
-            "Python Files (*.py)"
+            "Python Files (*.py)",
+            options=FILE_DIALOG_OPTIONS
         )
         if path:
             self.script_edit.setText(path)
-            self.config_manager.set("last_script_dir", str(Path(path).parent))
+            self._set_config("last_script_dir", str(Path(path).parent))
 
     def _browse_requirements(self):
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Requirements File", "",
-            "Text Files (*.txt);;All Files (*)"
+            "Text Files (*.txt);;All Files (*)",
+            options=FILE_DIALOG_OPTIONS
         )
         if path:
             self.req_edit.setText(path)
@@ -862,16 +1085,18 @@ class MainWindow(QMainWindow):
     def _browse_output(self):
         path = QFileDialog.getExistingDirectory(
             self, "Select Output Directory",
-            self.config_manager.config.last_output_dir
+            self.config_manager.config.last_output_dir,
+            options=FILE_DIALOG_OPTIONS | QFileDialog.ShowDirsOnly
         )
         if path:
             self.output_edit.setText(path)
-            self.config_manager.set("last_output_dir", path)
+            self._set_config("last_output_dir", path)
 
     def _browse_icon(self):
         path, _ = QFileDialog.getOpenFileName(
             self, "Select Icon File", "",
-            "Icon Files (*.ico)"
+            "Icon Files (*.ico)",
+            options=FILE_DIALOG_OPTIONS
         )
         if path:
             self.icon_edit.setText(path)
@@ -879,29 +1104,14 @@ class MainWindow(QMainWindow):
     # Build methods
     def _validate_inputs(self) -> bool:
         """Validate all inputs before build."""
-        # Script validation
-        valid, msg = validate_python_script(self.script_edit.text())
-        if not valid:
-            QMessageBox.warning(self, "Validation Error", msg)
-            return False
-
-        # Requirements validation
-        valid, msg = validate_requirements_file(self.req_edit.text())
-        if not valid:
-            QMessageBox.warning(self, "Validation Error", msg)
-            return False
-
-        # Icon validation
-        valid, msg = validate_icon_file(self.icon_edit.text())
-        if not valid:
-            QMessageBox.warning(self, "Validation Error", msg)
-            return False
-
-        # Output directory validation
-        valid, msg = validate_output_directory(self.output_edit.text())
-        if not valid:
-            QMessageBox.warning(self, "Validation Error", msg)
-            return False
+        from app.utils import validators
+
+        for validator_name, edit_attr in self._VALIDATION_SPEC:
+            validator = getattr(validators, validator_name)
+            valid, msg = validator(getattr(self, edit_attr).text())
+            if not valid:
+                QMessageBox.warning(self, "Validation Error", msg)
+                return False
 
         return True
 
@@ -914,7 +1124,7 @@ class MainWindow(QMainWindow):
         if not self._validate_inputs():
             return
 
-        self._save_config()
+        self._save_config(immediate=False)
 
         # Update UI state
         self.build_btn.setEnabled(False)
@@ -931,9 +1141,10 @@ class MainWindow(QMainWindow):
 
         # Get selected Python interpreter
         python_path = None
-        interp_text = self.interp_combo.currentText()
-        if not interp_text.startswith("Current:"):
-            python_path = interp_text
+        if self._tab_ready(self.ADVANCED_TAB):
+            interp_text = self.interp_combo.currentText()
+            if not interp_text.startswith("Current:"):
+                python_path = interp_text
 
         # Start build
         self.builder.start_build(
@@ -948,12 +1159,14 @@ class MainWindow(QMainWindow):
         """Cancel the current build."""
         if self.builder.is_building():
             self.builder.cancel_build()
+            self.cancel_btn.setEnabled(False)
             self.logger.warning("Build cancelled by user")
-            self.statusbar.showMessage("Build cancelled")
+            # _on_build_finished reports once PyInstaller has stopped
+            self.statusbar.showMessage("Cancelling build...")
 
-    def _on_build_output(self, line: str):
-        """Handle build output line."""
-        self.log_console.append_output(line)
+    def _on_build_output(self, text: str):
+        """Handle a batch of build output lines."""
+        self.log_console.append_output(text)
 
     def _on_build_status(self, status: str):
         """Handle build status update."""
@@ -992,6 +1205,9 @@ class MainWindow(QMainWindow):
 
     def _run_post_build_plugins(self, result: BuildResult):
         """Run post-build plugins."""
+        if self.plugin_loader is None:
+            self.logger.warning("Plugins are still loading; post-build plugins skipped")
+            return
         plugins = self.plugin_loader.get_post_build_plugins()
         if not plugins:
             return
@@ -1013,56 +1229,66 @@ class MainWindow(QMainWindow):
     # Dialog methods
     def _show_hidden_imports(self):
         """Show hidden imports dialog."""
-        dialog = HiddenImportsDialog(
-            self.config_manager.config.build_config.hidden_imports,
-            self
+        from app.windows.dialogs import HiddenImportsDialog
+        dialog = HiddenImportsDialog.open_for(
+            self,
+            self.config_manager.config.build_config.hidden_imports
         )
         if dialog.exec_() == QDialog.Accepted:
             self.config_manager.config.build_config.hidden_imports = dialog.get_imports()
-            self.config_manager.save()
+            self._schedule_config_save()
             self._update_hidden_imports_label()
 
     def _show_data_files(self):
         """Show data files dialog."""
-        dialog = DataFilesDialog(
-            self.config_manager.config.build_config.data_files,
-            self
+        from app.windows.dialogs import DataFilesDialog
+        dialog = DataFilesDialog.open_for(
+            self,
+            self.config_manager.config.build_config.data_files
         )
         if dialog.exec_() == QDialog.Accepted:
             self.config_manager.config.build_config.data_files = dialog.get_data_files()
-            self.config_manager.save()
+            self._schedule_config_save()
             self._update_data_files_label()
 
     def _show_installer_settings(self):
         """Show installer settings dialog."""
-        dialog = InstallerSettingsDialog(
-            self.config_manager.config.installer_config,
-            self
+        from app.windows.dialogs import InstallerSettingsDialog
+        dialog = InstallerSettingsDialog.open_for(
+            self,
+            self.config_manager.config.installer_config
         )
         if dialog.exec_() == QDialog.Accepted:
             self.config_manager.config.installer_config = dialog.get_config()
-            self.config_manager.save()
+            self._schedule_config_save()
             self._update_installer_status()
 
     def _show_about(self):
         """Show about dialog."""
-        dialog = AboutDialog(self)
+        from app.windows.dialogs import AboutDialog
+        dialog = AboutDialog.open_for(self)
         dialog.exec_()
 
     # Helper methods
     def _update_hidden_imports_label(self):
+        if not self._tab_ready(self.ADVANCED_TAB):
+            return
         count = len(self.config_manager.config.build_config.hidden_imports)
         self.hidden_imports_label.setText(
             f"{count} hidden import(s) configured" if count else "No hidden imports configured"
         )
 
     def _update_data_files_label(self):
+        if not self._tab_ready(self.ADVANCED_TAB):
+            return
         count = len(self.config_manager.config.build_config.data_files)
         self.data_files_label.setText(
             f"{count} data file(s) configured" if count else "No data files configured"
         )
 
     def _update_installer_status(self):
+        if not self._tab_ready(self.INSTALLER_TAB):
+            return
         config = self.config_manager.config.installer_config
         if config.enabled:
             self.installer_status_label.setText(
@@ -1072,43 +1298,76 @@ class MainWindow(QMainWindow):
             self.installer_status_label.setText("Installer: Disabled")
 
     def _update_plugins_list(self):
+        if not self._tab_ready(self.PLUGINS_TAB):
+            return
+        if self.plugin_loader is None:
+            self.plugins_list.setPlainText("Loading plugins...")
+            return
         plugins = self.plugin_loader.get_all_plugins()
         if plugins:
-            text = ""
+            parts = []
             for plugin in plugins:
                 info = plugin.get_info()
-                text += f"[{info.plugin_type}] {info.name} v{info.version}\n"
-                text += f"  {info.description}\n"
-                text += f"  Author: {info.author}\n\n"
-            self.plugins_list.setText(text)
+                parts.append(
+                    f"[{info.plugin_type}] {info.name} v{info.version}\n"
+                    f"  {info.description}\n"
+                    f"  Author: {info.author}\n\n"
+                )
+            text = "".join(parts)
         else:
-            self.plugins_list.setText("No plugins loaded.\n\nPlace .py plugin files in the 'plugins' folder.")
+            text = "No plugins loaded.\n\nPlace .py plugin files in the 'plugins' folder."
 
-    def _refresh_interpreters(self):
-        """Refresh list of Python interpreters."""
-        from app.core.venv_manager import VenvManager
-        venv_manager = VenvManager()
+        self.plugins_list.setUpdatesEnabled(False)
+        try:
+            self.plugins_list.setPlainText(text)
+        finally:
+            self.plugins_list.setUpdatesEnabled(True)
 
+    def _refresh_interpreters(self):
+        """Refresh list of Python interpreters on a pool thread."""
+        if self._interp_scanning:
+            return
+        if self._venv_manager is None:
+            from app.core.venv_manager import VenvManager
+            # Kept so its interpreter cache survives between refreshes
+            self._venv_manager = VenvManager()
+
+        self._interp_scanning = True
+        self._interp_task = _CallTask(self._venv_manager.get_python_interpreters)
+        self._interp_task.signals.done.connect(self._on_interpreters_found)
+        self._interp_task.signals.failed.connect(self._on_interpreter_scan_failed)
+        QThreadPool.globalInstance().start(self._interp_task)
+
+    def _on_interpreters_found(self, interpreters: List[str]):
+        """Fill the interpreter combo box with a finished scan's results."""
+        self._interp_scanning = False
         self.interp_combo.clear()
         self.interp_combo.addItem(f"Current: {sys.executable}")
 
-        for interp in venv_manager.get_python_interpreters():
+        for interp in interpreters:
             if interp != sys.executable:
                 self.interp_combo.addItem(interp)
 
+    def _on_interpreter_scan_failed(self, message: str):
+        """Allow another refresh after a scan raised."""
+        self._interp_scanning = False
+        self.logger.error(f"Failed to find Python interpreters: {message}")
+
     def _new_project(self):
         """Clear all fields for a new project."""
         self.script_edit.clear()
         self.req_edit.clear()
         self.app_name_edit.clear()
         self.icon_edit.clear()
-        self.additional_args_edit.clear()
-        self.exclude_modules_edit.clear()
+        if self._tab_ready(self.ADVANCED_TAB):
+            self.additional_args_edit.clear()
+            self.exclude_modules_edit.clear()
         self.onefile_check.setChecked(True)
         self.console_check.setChecked(True)
         self.clean_check.setChecked(True)
         self.config_manager.config.build_config.hidden_imports = []
         self.config_manager.config.build_config.exclude_modules = []
+        self.config_manager.config.build_config.additional_args = ""
         self.config_manager.config.build_config.data_files = []
         self._update_hidden_imports_label()
         self._update_data_files_label()
@@ -1125,7 +1384,8 @@ class MainWindow(QMainWindow):
 
     def _load_preset(self):
         """Load a saved preset."""
-        dialog = PresetsDialog(self.config_manager, self)
+        from app.windows.dialogs import PresetsDialog
+        dialog = PresetsDialog.open_for(self, self.config_manager)
         if dialog.exec_() == QDialog.Accepted:
             preset_name = dialog.get_selected_preset()
             if preset_name:
@@ -1149,10 +1409,30 @@ class MainWindow(QMainWindow):
 
     def _reload_plugins(self):
         """Reload all plugins."""
+        if self.plugin_loader is None:
+            return
         self.plugin_loader.reload_plugins()
         self._update_plugins_list()
         self.logger.info("Plugins reloaded")
 
+    def showEvent(self, event):
+        """Start loading plugins the first time the window is shown."""
+        super().showEvent(event)
+        if self._plugin_task is None:
+            self._plugin_task = _CallTask(get_plugin_loader)
+            self._plugin_task.signals.done.connect(self._on_plugins_loaded)
+            self._plugin_task.signals.failed.connect(self._on_plugins_failed)
+            QThreadPool.globalInstance().start(self._plugin_task)
+
+    def _on_plugins_loaded(self, loader: PluginLoader):
+        """Store the loaded plugins and refresh the plugins tab."""
+        self.plugin_loader = loader
+        self._update_plugins_list()
+
+    def _on_plugins_failed(self, message: str):
+        """Report a plugin loader that could not be created."""
+        self.logger.error(f"Failed to load plugins: {message}")
+
     def closeEvent(self, event):
         """Handle window close event."""
         self._save_config()
@@ -0,0 +1,26 @@
+"""Stylesheets shared between the main window and dialogs."""
+
+
+# Dialog widget styles, keyed by objectName. Appended to the window's theme
+# stylesheet so Qt parses them once per theme change instead of per dialog.
+DIALOG_STYLESHEET = """
+    QLabel#installerNote {
+        color: gray;
+        font-style: italic;
+    }
+    QPushButton#aboutClose {
+        background-color: transparent;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        color: #aaaaaa;
+        font-size: 10pt;
+    }
+    QPushButton#aboutClose:hover {
+        background-color: #3a3a3a;
+        border-color: #666666;
+        color: #ffffff;
+    }
+    QPushButton#aboutClose:pressed {
+        background-color: #2a2a2a;
+    }
+"""
@@ -5,17 +5,193 @@ A post-build plugin that creates a ZIP archive of the build output.
 This serves as an example plugin demonstrating the plugin system.
 """
 
+import json
+import os
+import shutil
+import struct
+import tempfile
+import time
 import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
+from operator import attrgetter
 
-# Import plugin base classes from the main app
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+# The plugin loader runs inside the app, so its packages are importable
+from app.core.logger import LogLevel
 from app.core.plugin_loader import PostBuildPlugin
+from app.utils.fs_fast import is_link, is_remote_path, rmtree_fast
+
+try:
+    # SIMD-accelerated deflate with the same API and output format as zlib
+    from zlib_ng import zlib_ng as zlib
+except ImportError:  # optional, stdlib zlib is used as a fallback
+    import zlib
+
+# AppConfig.zip_compression values and the zipfile method each selects
+_COMPRESSION_METHODS = {
+    "stored": zipfile.ZIP_STORED,
+    "deflated": zipfile.ZIP_DEFLATED,
+    "bzip2": zipfile.ZIP_BZIP2,
+    "lzma": zipfile.ZIP_LZMA,
+}
+
+
+# Formats that are already compressed; deflating them again saves almost nothing
+STORE_EXTS = frozenset({
+    '.zip', '.png', '.jpg', '.jpeg', '.gz', '.xz', '.7z', '.pyd', '.so',
+    '.dll', '.mp3', '.mp4', '.webp',
+})
+# Files of other types above this size are sampled before being deflated
+SAMPLE_MIN_SIZE = 1024 * 1024
+SAMPLE_SIZE = 64 * 1024
+# A sample that deflates to more than this fraction of its size is stored
+INCOMPRESSIBLE_RATIO = 0.95
+# Read size used when streaming members that are not held in memory
+STREAM_BUFFER_SIZE = 1024 * 1024
+# Fixed-size part of a ZIP local file header and its signature
+LOCAL_HEADER_SIZE = 30
+LOCAL_HEADER_MAGIC = b"PK\x03\x04"
+
+
+def _is_incompressible(sample: bytes) -> bool:
+    """Return True if a quick deflate of sample barely shrinks it."""
+    return len(zlib.compress(sample, 1)) > INCOMPRESSIBLE_RATIO * len(sample)
+
+
+def _has_store_ext(path: str) -> bool:
+    """Return True if path has the extension of an already-compressed format."""
+    return os.path.splitext(path)[1].lower() in STORE_EXTS
+
+
+def _should_store(path: str, size: int) -> bool:
+    """Decide whether a file is written with ZIP_STORED instead of deflated."""
+    if _has_store_ext(path):
+        return True
+    if size < SAMPLE_MIN_SIZE:
+        return False
+    with open(path, 'rb') as f:
+        return _is_incompressible(f.read(SAMPLE_SIZE))
+
+
+def _compress_file(path: str, level: int) -> Tuple[int, int, int, bytes]:
+    """Read a file and prepare its ZIP member data.
+
+    Already-compressed files are kept as is; everything else is deflated
+    as a raw member stream. Returns (compress_type, crc32, uncompressed
+    size, member bytes).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    crc = zlib.crc32(data)
+    if _has_store_ext(path) or (
+            len(data) >= SAMPLE_MIN_SIZE and _is_incompressible(data[:SAMPLE_SIZE])):
+        return zipfile.ZIP_STORED, crc, len(data), data
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return zipfile.ZIP_DEFLATED, crc, len(data), compressed
+
+
+def _begin_member(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo):
+    """Write the local header of a member whose data is already compressed.
+
+    zipfile has no public API for this, so the header is written the same
+    way ZipFile.writestr does before its compressor runs. ZipFile._writecheck
+    is skipped: the archive is opened for writing with allowZip64, the walk
+    yields each name once and members only use the archive's own method or
+    stored, so none of its checks can fail.
+    """
+    zipf._didModify = True
+    zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT
+             or zinfo.compress_size > zipfile.ZIP64_LIMIT)
+    zinfo.header_offset = zipf.fp.tell()
+    zipf.fp.write(zinfo.FileHeader(zip64))
+
+
+def _end_member(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo):
+    """Register a member written with _begin_member for the central directory."""
+    zipf.start_dir = zipf.fp.tell()
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _write_compressed(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, data: bytes):
+    """Append a member whose data is already compressed."""
+    _begin_member(zipf, zinfo)
+    zipf.fp.write(data)
+    _end_member(zipf, zinfo)
+
+
+def _copy_member(zipf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, src, header_offset: int):
+    """Copy a member's compressed data from another archive without recompressing.
+
+    src is the other archive opened in binary mode; raises ValueError if no
+    local header is found at header_offset.
+    """
+    src.seek(header_offset)
+    header = src.read(LOCAL_HEADER_SIZE)
+    if len(header) != LOCAL_HEADER_SIZE or header[:4] != LOCAL_HEADER_MAGIC:
+        raise ValueError("no local file header at recorded offset")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src.seek(name_len + extra_len, os.SEEK_CUR)
+
+    _begin_member(zipf, zinfo)
+    remaining = zinfo.compress_size
+    while remaining:
+        chunk = src.read(min(remaining, STREAM_BUFFER_SIZE))
+        if not chunk:
+            raise ValueError("archive ended inside a member")
+        zipf.fp.write(chunk)
+        remaining -= len(chunk)
+    _end_member(zipf, zinfo)
+
+
+def _walk_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every regular file below root.
+
+    Uses the entry types os.scandir already returns instead of a stat()
+    per path; symlinked directories are not followed.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _zipinfo_for(arcname: str, st: os.stat_result) -> zipfile.ZipInfo:
+    """Build a member's ZipInfo from a stat result already in hand.
+
+    Same fields as ZipInfo.from_file, without stat()ing the file again.
+    """
+    zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+    zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+    zinfo.file_size = st.st_size
+    return zinfo
+
+
+def _stream_file(zipf: zipfile.ZipFile, path, arcname, compress_type=None,
+                 st: Optional[os.stat_result] = None):
+    """Copy a file into the archive in large chunks.
+
+    ZipFile.write reads in 8 KiB blocks; a 1 MiB buffer cuts the read
+    and compressor calls for big members by two orders of magnitude.
+    """
+    if st is None:
+        zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    else:
+        zinfo = _zipinfo_for(arcname, st)
+    if compress_type is None:
+        compress_type = zipf.compression
+    zinfo.compress_type = compress_type
+    zinfo._compresslevel = zipf.compresslevel
+    with open(path, 'rb', buffering=0) as src, zipf.open(zinfo, 'w') as dst:
+        shutil.copyfileobj(src, dst, STREAM_BUFFER_SIZE)
 
 
 class ZipOutputPlugin(PostBuildPlugin):
@@ -27,6 +203,153 @@ class ZipOutputPlugin(PostBuildPlugin):
     AUTHOR = "PyInstaller Builder"
     PLUGIN_TYPE = "post_build"
 
+    # Used when the app config does not choose a method or level
+    DEFAULT_COMPRESSION = "deflated"
+    DEFAULT_LEVEL = 6
+    # Threads compressing files; zlib releases the GIL while it works
+    MAX_WORKERS = min(8, os.cpu_count() or 1)
+    # Files read and compressed ahead of the writer
+    MAX_IN_FLIGHT = 2 * MAX_WORKERS
+    # Larger files are streamed by zipfile instead of held in memory
+    IN_MEMORY_LIMIT = 8 * 1024 * 1024
+
+    # Per-app manifest of the last archive, kept next to the archives
+    MANIFEST_NAME = ".{app_name}.zipmanifest.json"
+
+    def _load_manifest(self, manifest_path: Path, compression: str,
+                       level: int) -> Optional[Dict[str, Any]]:
+        """Return the previous archive's manifest if its members can be reused."""
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            zip_stat = os.stat(manifest['zip'])
+        except (OSError, ValueError, KeyError):
+            return None
+        if (manifest.get('compression') != compression
+                or manifest.get('level') != level
+                or manifest.get('zip_size') != zip_stat.st_size
+                or manifest.get('zip_mtime_ns') != zip_stat.st_mtime_ns):
+            return None
+        return manifest
+
+    def _save_manifest(self, manifest_path: Path, zip_path: Path, compression: str,
+                       level: int, zipf: zipfile.ZipFile,
+                       stats: Dict[str, Tuple[int, int]]):
+        """Record where each member of the new archive lives, for the next run."""
+        entries = {}
+        for zinfo in zipf.infolist():
+            stat = stats.get(zinfo.filename)
+            if stat is not None:
+                entries[zinfo.filename] = [
+                    stat[0], stat[1], zinfo.compress_type, zinfo.CRC,
+                    zinfo.compress_size, zinfo.header_offset,
+                ]
+        zip_stat = zip_path.stat()
+        manifest = {
+            'zip': str(zip_path),
+            'zip_size': zip_stat.st_size,
+            'zip_mtime_ns': zip_stat.st_mtime_ns,
+            'compression': compression,
+            'level': level,
+            'entries': entries,
+        }
+        tmp_path = manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, manifest_path)
+
+    def _zip_directory(self, zipf: zipfile.ZipFile, output_path: Path, method: int,
+                       level: int, previous: Optional[Dict[str, Any]]
+                       ) -> Dict[str, Tuple[int, int]]:
+        """Add every file under output_path to the archive.
+
+        Unchanged files are copied compressed from the previous archive;
+        with deflate the rest are compressed on worker threads. Returns
+        (mtime_ns, size) per member name for the new manifest.
+        """
+        pending = deque()
+        stats: Dict[str, Tuple[int, int]] = {}
+        root = os.fspath(output_path)
+        # Every walked path starts with this, so arcnames are a slice
+        prefix = os.path.join(os.path.dirname(root), '')
+        prefix_len = len(prefix)
+        old_entries = previous['entries'] if previous else {}
+        old_src = open(previous['zip'], 'rb') if previous else None
+        # Checked once; per-member messages are only built when a sink uses them
+        log_members = self.logger.is_enabled_for(LogLevel.DEBUG)
+
+        def write_next():
+            arcname, st, future = pending.popleft()
+            compress_type, crc, size, compressed = future.result()
+            zinfo = _zipinfo_for(arcname, st)
+            zinfo.compress_type = compress_type
+            zinfo.CRC = crc
+            zinfo.file_size = size
+            zinfo.compress_size = len(compressed)
+            _write_compressed(zipf, zinfo, compressed)
+            if log_members:
+                self.logger.debug(f"  Added: {arcname}")
+
+        def reuse(arcname, st, entry) -> bool:
+            zinfo = _zipinfo_for(arcname, st)
+            zinfo.compress_type = entry[2]
+            zinfo.CRC = entry[3]
+            zinfo.file_size = entry[1]
+            zinfo.compress_size = entry[4]
+            try:
+                _copy_member(zipf, zinfo, old_src, entry[5])
+            except ValueError:
+                return False
+            if log_members:
+                self.logger.debug(f"  Reused: {arcname}")
+            return True
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+                # Sorted so sibling files, which tend to be alike, sit together
+                for entry in sorted(_walk_files(root), key=attrgetter('path')):
+                    file_path = entry.path
+                    if file_path.startswith(prefix):
+                        arcname = file_path[prefix_len:]
+                    else:
+                        arcname = os.path.relpath(file_path, prefix)
+                    name = arcname.replace(os.sep, '/')
+                    st = entry.stat(follow_symlinks=False)
+                    size = st.st_size
+                    stats[name] = (st.st_mtime_ns, size)
+
+                    old = old_entries.get(name)
+                    if old is not None and old[0] == st.st_mtime_ns and old[1] == size:
+                        # Keep archive order stable: finish queued members first
+                        while pending:
+                            write_next()
+                        if reuse(arcname, st, old):
+                            continue
+
+                    if method == zipfile.ZIP_DEFLATED and size <= self.IN_MEMORY_LIMIT:
+                        future = pool.submit(_compress_file, file_path, level)
+                        pending.append((arcname, st, future))
+                        if len(pending) >= self.MAX_IN_FLIGHT:
+                            write_next()
+                        continue
+
+                    # Large files, and bzip2/lzma members, are streamed
+                    while pending:
+                        write_next()
+                    compress_type = (zipfile.ZIP_STORED if _should_store(file_path, size)
+                                     else method)
+                    _stream_file(zipf, file_path, arcname, compress_type, st)
+                    if log_members:
+                        self.logger.debug(f"  Added: {arcname}")
+
+                while pending:
+                    write_next()
+        finally:
+            if old_src is not None:
+                old_src.close()
+
+        return stats
+
     def execute(self, context: Dict[str, Any]) -> bool:
         """
         Create a ZIP archive of the build output.
@@ -58,20 +381,56 @@ class ZipOutputPlugin(PostBuildPlugin):
             zip_filename = f"{app_name}_{timestamp}.zip"
             zip_path = output_path.parent / zip_filename
 
+            app_config = context.get('app_config')
+            compression = getattr(app_config, 'zip_compression', self.DEFAULT_COMPRESSION)
+            method = _COMPRESSION_METHODS.get(compression)
+            if method is None:
+                self.logger.warning(
+                    f"Zip Output: Unknown compression '{compression}', "
+                    f"using {self.DEFAULT_COMPRESSION}"
+                )
+                compression = self.DEFAULT_COMPRESSION
+                method = _COMPRESSION_METHODS[compression]
+            level = getattr(app_config, 'zip_compresslevel', self.DEFAULT_LEVEL)
+
             self.logger.info(f"Zip Output: Creating archive at {zip_path}")
 
-            # Create ZIP archive
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # If output_path is a directory, add all its contents
-                if output_path.is_dir():
-                    for file_path in output_path.rglob('*'):
-                        if file_path.is_file():
-                            arcname = file_path.relative_to(output_path.parent)
-                            zipf.write(file_path, arcname)
-                            self.logger.debug(f"  Added: {arcname}")
-                else:
-                    # If it's a single file, just add it
-                    zipf.write(output_path, output_path.name)
+            manifest_path = output_path.parent / self.MANIFEST_NAME.format(app_name=app_name)
+            stats = None
+
+            # On network drives, build the archive locally and move it over
+            # in one sequential copy instead of thousands of small writes
+            staging_path = None
+            if is_remote_path(zip_path.parent):
+                fd, staging = tempfile.mkstemp(suffix='.zip')
+                os.close(fd)
+                staging_path = Path(staging)
+                self.logger.info("Zip Output: Staging archive in the temp folder")
+
+            try:
+                # Create ZIP archive
+                with zipfile.ZipFile(staging_path or zip_path, 'w', method,
+                                     allowZip64=True, compresslevel=level) as zipf:
+                    # If output_path is a directory, add all its contents
+                    if output_path.is_dir():
+                        previous = self._load_manifest(manifest_path, compression, level)
+                        stats = self._zip_directory(zipf, output_path, method, level,
+                                                    previous)
+                    else:
+                        # If it's a single file, just add it
+                        _stream_file(zipf, output_path, output_path.name)
+                if staging_path is not None:
+                    shutil.move(str(staging_path), str(zip_path))
+            finally:
+                if staging_path is not None and staging_path.exists():
+                    staging_path.unlink()
+
+            if stats is not None:
+                try:
+                    self._save_manifest(manifest_path, zip_path, compression,
+                                        level, zipf, stats)
+                except OSError as e:
+                    self.logger.warning(f"Zip Output: Could not save manifest: {e}")
 
             self.logger.success(f"Zip Output: Archive created successfully: {zip_path}")
             return True
@@ -117,8 +476,16 @@ class CleanBuildPlugin(PostBuildPlugin):
             # Clean up build folder
             build_folder = script_dir / "build"
             if build_folder.exists():
-                import shutil
-                shutil.rmtree(build_folder)
+                if is_link(build_folder):
+                    # Deleting through the link would empty its target
+                    raise OSError(f"Build folder is a symbolic link: {build_folder}")
+                try:
+                    rmtree_fast(build_folder)
+                except OSError:
+                    # Whatever the fast path left behind goes the slow way
+                    shutil.rmtree(build_folder, ignore_errors=True)
+                    if build_folder.exists():
+                        raise
                 self.logger.info("Clean Build: Removed build folder")
 
             self.logger.success("Clean Build: Cleanup completed")